@@ -1,7 +1,6 @@
 """Dependency injection container using Factory pattern."""
 
-from pathlib import Path
-from typing import Optional
+from functools import cached_property
 
 from ytdlp_subs.application.services.file_processor import SubtitleFileProcessor
 from ytdlp_subs.application.services.filename_generator import FilenameGenerator
@@ -23,6 +22,8 @@ class Container:
     Dependency injection container.
 
     Follows the Factory pattern to create and wire up all dependencies.
+    Each dependency is a cached_property: built on first access, then read
+    straight from the instance dict.
     """
 
     def __init__(self, config: AppConfig) -> None:
@@ -37,111 +38,95 @@ class Container:
         # Ensure output directory exists
         self.config.ensure_output_dir()
 
-        # Initialize infrastructure
-        self._command_executor: Optional[CommandExecutor] = None
-        self._cache_repository: Optional[FileCacheRepository] = None
-        self._video_repository: Optional[YtDlpVideoRepository] = None
-        self._subtitle_repository: Optional[FileSystemSubtitleRepository] = None
-        self._error_repository: Optional[FileErrorRepository] = None
-
-        # Initialize services
-        self._subtitle_downloader: Optional[YtDlpSubtitleDownloader] = None
-        self._file_processor: Optional[SubtitleFileProcessor] = None
-        self._filename_generator: Optional[FilenameGenerator] = None
-
-        # Initialize use cases
-        self._download_orchestrator: Optional[DownloadOrchestrator] = None
-
-    @property
+    @cached_property
     def command_executor(self) -> CommandExecutor:
-        """Get or create command executor."""
-        if self._command_executor is None:
-            self._command_executor = CommandExecutor(timeout=300)  # 5 minute timeout
-        return self._command_executor
+        """Create command executor."""
+        return CommandExecutor(timeout=300)  # 5 minutes per video; batches scale it
 
-    @property
+    @cached_property
     def cache_repository(self) -> FileCacheRepository:
-        """Get or create cache repository."""
-        if self._cache_repository is None:
-            cache_file = self.config.get_cache_path()
-            self._cache_repository = FileCacheRepository(cache_file=cache_file)
-        return self._cache_repository
+        """Create cache repository."""
+        cache_file = self.config.get_cache_path()
+        return FileCacheRepository(cache_file=cache_file)
 
-    @property
+    @cached_property
     def error_repository(self) -> FileErrorRepository:
-        """Get or create error repository."""
-        if self._error_repository is None:
-            self._error_repository = FileErrorRepository(error_log_path=self.config.error_log)
-        return self._error_repository
+        """Create error repository."""
+        return FileErrorRepository(
+            error_log_path=self.config.error_log,
+            flush_interval=self.config.batch_size,
+        )
 
-    @property
+    @cached_property
     def video_repository(self) -> YtDlpVideoRepository:
-        """Get or create video repository."""
-        if self._video_repository is None:
-            self._video_repository = YtDlpVideoRepository(
-                command_executor=self.command_executor,
-                cookies_from_browser=self.config.cookies_from_browser,
-                js_runtimes=self.config.js_runtimes,
-                remote_components=self.config.remote_components,
-            )
-        return self._video_repository
-
-    @property
+        """Create video repository."""
+        return YtDlpVideoRepository(
+            command_executor=self.command_executor,
+            cookies_from_browser=self.config.cookies_from_browser,
+            js_runtimes=self.config.js_runtimes,
+            remote_components=self.config.remote_components,
+            allowed_langs=frozenset(lang.value for lang in self.config.get_languages()),
+        )
+
+    @cached_property
     def subtitle_repository(self) -> FileSystemSubtitleRepository:
-        """Get or create subtitle repository."""
-        if self._subtitle_repository is None:
-            self._subtitle_repository = FileSystemSubtitleRepository(
-                output_dir=self.config.output_dir,
-            )
-        return self._subtitle_repository
+        """Create subtitle repository."""
+        return FileSystemSubtitleRepository(
+            output_dir=self.config.output_dir,
+        )
 
-    @property
+    @cached_property
     def subtitle_downloader(self) -> YtDlpSubtitleDownloader:
-        """Get or create subtitle downloader."""
-        if self._subtitle_downloader is None:
-            self._subtitle_downloader = YtDlpSubtitleDownloader(
-                command_executor=self.command_executor,
-                cookies_from_browser=self.config.cookies_from_browser,
-                js_runtimes=self.config.js_runtimes,
-                remote_components=self.config.remote_components,
+        """Create subtitle downloader."""
+        downloader_class = YtDlpSubtitleDownloader
+        if self.config.in_process:
+            # Imported here so subprocess mode does not pay for importing yt-dlp
+            from ytdlp_subs.application.services.ytdlp_api_downloader import (
+                YtDlpApiSubtitleDownloader,
             )
-        return self._subtitle_downloader
 
-    @property
+            downloader_class = YtDlpApiSubtitleDownloader
+
+        return downloader_class(
+            command_executor=self.command_executor,
+            cookies_from_browser=self.config.cookies_from_browser,
+            js_runtimes=self.config.js_runtimes,
+            remote_components=self.config.remote_components,
+            sleep_subtitles=int(self.config.min_wait_seconds),
+            retry_base_wait=self.config.min_wait_seconds,
+        )
+
+    @cached_property
     def file_processor(self) -> SubtitleFileProcessor:
-        """Get or create file processor."""
-        if self._file_processor is None:
-            self._file_processor = SubtitleFileProcessor()
-        return self._file_processor
+        """Create file processor."""
+        return SubtitleFileProcessor()
 
-    @property
+    @cached_property
     def filename_generator(self) -> FilenameGenerator:
-        """Get or create filename generator."""
-        if self._filename_generator is None:
-            self._filename_generator = FilenameGenerator(
-                enable_numbering=self.config.enable_numbering,
-            )
-        return self._filename_generator
+        """Create filename generator."""
+        return FilenameGenerator(
+            enable_numbering=self.config.enable_numbering,
+        )
 
-    @property
+    @cached_property
     def download_orchestrator(self) -> DownloadOrchestrator:
-        """Get or create download orchestrator."""
-        if self._download_orchestrator is None:
-            # Determine output format
-            output_format = SubtitleFormat.TXT if self.config.clean_txt else None
-
-            self._download_orchestrator = DownloadOrchestrator(
-                video_repository=self.video_repository,
-                subtitle_repository=self.subtitle_repository,
-                cache_repository=self.cache_repository,
-                error_repository=self.error_repository,
-                subtitle_downloader=self.subtitle_downloader,
-                file_processor=self.file_processor,
-                filename_generator=self.filename_generator,
-                language_preferences=self.config.get_languages(),
-                min_wait_seconds=self.config.min_wait_seconds,
-                max_wait_seconds=self.config.max_wait_seconds,
-                output_format=output_format,
-                force_refresh=self.config.force_refresh,
-            )
-        return self._download_orchestrator
+        """Create download orchestrator."""
+        # Determine output format
+        output_format = SubtitleFormat.TXT if self.config.clean_txt else None
+
+        return DownloadOrchestrator(
+            video_repository=self.video_repository,
+            subtitle_repository=self.subtitle_repository,
+            cache_repository=self.cache_repository,
+            error_repository=self.error_repository,
+            subtitle_downloader=self.subtitle_downloader,
+            file_processor=self.file_processor,
+            filename_generator=self.filename_generator,
+            language_preferences=self.config.get_languages(),
+            min_wait_seconds=self.config.min_wait_seconds,
+            max_wait_seconds=self.config.max_wait_seconds,
+            output_format=output_format,
+            force_refresh=self.config.force_refresh,
+            batch_size=self.config.batch_size,
+            concurrency=self.config.concurrency,
+        )
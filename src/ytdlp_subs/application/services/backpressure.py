@@ -0,0 +1,53 @@
+"""Adaptive backpressure controller for pacing yt-dlp requests."""
+
+import threading
+
+from ytdlp_subs.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class BackpressureController:
+    """
+    AIMD controller for the wait between requests.
+
+    Every successful request additively shortens the wait towards the
+    minimum; every throttled request multiplicatively lengthens it towards
+    the maximum. Safe to share between worker threads.
+    """
+
+    def __init__(
+        self,
+        min_wait: float,
+        max_wait: float,
+        alpha: float = 0.5,
+        beta: float = 2.0,
+    ) -> None:
+        """
+        Initialize backpressure controller.
+
+        Args:
+            min_wait: Lower bound for the wait in seconds
+            max_wait: Upper bound for the wait in seconds
+            alpha: Seconds removed from the wait after each success
+            beta: Factor applied to the wait after each throttle
+        """
+        self.min_wait = min_wait
+        self.max_wait = max_wait
+        self.alpha = alpha
+        self.beta = beta
+        self.current_wait = min_wait
+        self._lock = threading.Lock()
+
+    def on_success(self) -> None:
+        """Additively decrease the wait after an unthrottled request."""
+        with self._lock:
+            self.current_wait = max(self.min_wait, self.current_wait - self.alpha)
+
+    def on_throttle(self) -> None:
+        """Multiplicatively increase the wait after a throttled request."""
+        with self._lock:
+            # Step off zero so the multiplicative increase has something to grow
+            increased = max(self.current_wait, self.alpha) * self.beta
+            self.current_wait = min(self.max_wait, increased)
+            logger.warning("Rate limited, backing off", wait_seconds=f"{self.current_wait:.2f}")
@@ -1,6 +1,7 @@
 """File processor service for subtitle file transformations."""
 
 import re
+from itertools import groupby
 from pathlib import Path
 from typing import Optional
 
@@ -11,10 +12,22 @@ from ytdlp_subs.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+# HTML/styling tags such as <c> or <00:00:01.000>
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Whole VTT lines that carry no text: headers, numeric cue identifiers and
+# timestamp lines (anything containing -->)
+_JUNK_LINE_RE = re.compile(
+    r"^[^\S\n]*(?:WEBVTT|Kind:|Language:|\d+[^\S\n]*$|.*-->).*$",
+    re.MULTILINE,
+)
+
 
 class SubtitleFileProcessor(IFileProcessorService):
     """Service for processing subtitle files."""
 
+    __slots__ = ()
+
     def process_file(
         self,
         input_file: Path,
@@ -69,20 +82,14 @@ class SubtitleFileProcessor(IFileProcessorService):
         """
         logger.info("Converting VTT to clean TXT", vtt_file=str(vtt_file))
 
-        if not vtt_file.exists():
-            raise FileProcessingError(
-                f"VTT file does not exist: {vtt_file}",
-                file_path=str(vtt_file),
-            )
-
         txt_file = vtt_file.with_suffix(".txt")
 
         try:
+            # Reading reports a missing file itself; no separate exists() probe
             cleaned_lines = self._clean_vtt_content(vtt_file)
 
             # Write cleaned content
-            with open(txt_file, "w", encoding="utf-8") as f:
-                f.write("\n".join(cleaned_lines))
+            txt_file.write_text("\n".join(cleaned_lines), encoding="utf-8")
 
             # Delete original VTT file
             vtt_file.unlink()
@@ -96,6 +103,12 @@ class SubtitleFileProcessor(IFileProcessorService):
 
             return txt_file
 
+        except FileNotFoundError as e:
+            raise FileProcessingError(
+                f"VTT file does not exist: {vtt_file}",
+                file_path=str(vtt_file),
+            ) from e
+
         except (IOError, OSError) as e:
             logger.error(
                 "Failed to convert VTT to TXT",
@@ -117,41 +130,14 @@ class SubtitleFileProcessor(IFileProcessorService):
         Returns:
             List of cleaned lines
         """
-        cleaned_lines: list[str] = []
-        last_line: Optional[str] = None
-
-        with open(vtt_file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-
-                # Skip empty lines
-                if not line:
-                    continue
-
-                # Skip timestamp lines (contains -->)
-                if "-->" in line:
-                    continue
-
-                # Skip numeric lines (cue identifiers)
-                if line.isdigit():
-                    continue
-
-                # Skip WEBVTT headers
-                if line.startswith("WEBVTT") or line.startswith("Kind:") or line.startswith("Language:"):
-                    continue
-
-                # Remove HTML tags
-                line = re.sub(r"<[^>]+>", "", line).strip()
-
-                # Skip if line is empty after cleaning
-                if not line:
-                    continue
-
-                # Skip duplicate consecutive lines
-                if line == last_line:
-                    continue
+        # Decode once: auto-generated captions often pad lines with NBSP or
+        # ideographic spaces, which only str patterns and str.strip treat as
+        # whitespace (and only str \d matches non-ASCII cue numbers)
+        text = vtt_file.read_text(encoding="utf-8")
 
-                cleaned_lines.append(line)
-                last_line = line
+        # Drop headers, cue identifiers and timestamps in one pass over the
+        # whole file, then strip tags from what is left
+        text = _TAG_RE.sub("", _JUNK_LINE_RE.sub("", text))
 
-        return cleaned_lines
+        # Skip empty lines and duplicate consecutive lines
+        return [line for line, _ in groupby(filter(None, map(str.strip, text.splitlines())))]
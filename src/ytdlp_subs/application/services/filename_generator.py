@@ -1,6 +1,6 @@
 """Filename generator service."""
 
-import re
+from functools import lru_cache
 from typing import Optional
 
 from ytdlp_subs.domain.models import SubtitleFormat, SubtitleLanguage, VideoMetadata
@@ -9,14 +9,34 @@ from ytdlp_subs.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Characters not allowed in filenames, deleted with a single str.translate pass
+INVALID_CHARS_TABLE = str.maketrans("", "", '\\/*?:"<>|')
+MAX_TITLE_LENGTH = 100
+
+
+@lru_cache(maxsize=4096)
+def sanitize_title(title: str) -> str:
+    """
+    Sanitize title for use in filename.
+
+    Cached because titles repeat within a channel (series episodes, reuploads).
+
+    Args:
+        title: Original title
+
+    Returns:
+        Sanitized title
+    """
+    # Remove invalid characters and truncate to max length
+    safe_title = title.translate(INVALID_CHARS_TABLE).strip()[:MAX_TITLE_LENGTH]
+
+    # Replace empty title
+    return safe_title or "UnknownTitle"
+
 
 class FilenameGenerator(IFilenameGeneratorService):
     """Service for generating subtitle filenames."""
 
-    # Characters not allowed in filenames
-    INVALID_CHARS_PATTERN = re.compile(r'[\\/*?:"<>|]')
-    MAX_TITLE_LENGTH = 100
-
     def __init__(self, enable_numbering: bool = True) -> None:
         """
         Initialize filename generator.
@@ -25,6 +45,8 @@ class FilenameGenerator(IFilenameGeneratorService):
             enable_numbering: Whether to prepend sequential numbers
         """
         self.enable_numbering = enable_numbering
+        # (total_count, padding) - the total is constant for a whole run
+        self._padding_for: tuple[Optional[int], int] = (None, 4)
 
     def generate_filename(
         self,
@@ -50,50 +72,24 @@ class FilenameGenerator(IFilenameGeneratorService):
             Generated filename
         """
         # Sanitize title
-        safe_title = self._sanitize_title(video_metadata.title)
-
-        # Build base name
-        base_name = f"{video_metadata.video_id}_{safe_title}"
+        safe_title = sanitize_title(video_metadata.title)
 
-        # Add numbering prefix if enabled
+        # Build the whole name in one f-string, with the numbering prefix if enabled
+        video_id = video_metadata.video_id.value
         if self.enable_numbering and index is not None:
             prefix = self._generate_number_prefix(index, total_count)
-            base_name = f"{prefix}_{base_name}"
-
-        # Add language and format extension
-        filename = f"{base_name}.{language.value}.{format.value}"
+            filename = f"{prefix}_{video_id}_{safe_title}.{language.value}.{format.value}"
+        else:
+            filename = f"{video_id}_{safe_title}.{language.value}.{format.value}"
 
         logger.debug(
             "Generated filename",
-            video_id=str(video_metadata.video_id),
+            video_id=video_id,
             filename=filename,
         )
 
         return filename
 
-    def _sanitize_title(self, title: str) -> str:
-        """
-        Sanitize title for use in filename.
-
-        Args:
-            title: Original title
-
-        Returns:
-            Sanitized title
-        """
-        # Remove invalid characters
-        safe_title = self.INVALID_CHARS_PATTERN.sub("", title).strip()
-
-        # Truncate to max length
-        if len(safe_title) > self.MAX_TITLE_LENGTH:
-            safe_title = safe_title[: self.MAX_TITLE_LENGTH]
-
-        # Replace empty title
-        if not safe_title:
-            safe_title = "UnknownTitle"
-
-        return safe_title
-
     def _generate_number_prefix(
         self,
         index: int,
@@ -111,8 +107,13 @@ class FilenameGenerator(IFilenameGeneratorService):
         """
         if total_count is None:
             # Default padding
-            return str(index).zfill(4)
+            return f"{index:04d}"
+
+        # Calculate padding based on total count, once per distinct total
+        cached_total, padding = self._padding_for
+        if cached_total != total_count:
+            padding = len(str(total_count))
+            self._padding_for = (total_count, padding)
 
-        # Calculate padding based on total count
-        padding = len(str(total_count))
-        return str(index).zfill(padding)
+        # One formatting call instead of str() plus zfill()
+        return f"{index:0{padding}d}"
@@ -0,0 +1,60 @@
+"""Token bucket rate limiter for launching yt-dlp requests."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket that releases one request per interval with a bounded burst.
+
+    Requests go through immediately while tokens are available and only wait
+    once the bucket is empty, so the good path is never slowed down by a
+    fixed sleep. Safe to share between worker threads.
+    """
+
+    def __init__(self, interval: float, capacity: int = 1) -> None:
+        """
+        Initialize token bucket.
+
+        Args:
+            interval: Seconds needed to refill one token (0 disables limiting)
+            capacity: Maximum number of tokens, i.e. the allowed burst
+        """
+        self.interval = interval
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """Take one token, blocking until one is available."""
+        with self._condition:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                self._condition.wait((1 - self._tokens) * self.interval)
+
+    def set_interval(self, interval: float) -> None:
+        """
+        Change the refill interval, waking waiters so they see the new rate.
+
+        Args:
+            interval: Seconds needed to refill one token (0 disables limiting)
+        """
+        with self._condition:
+            self._refill()
+            self.interval = interval
+            self._condition.notify_all()
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill (caller holds the lock)."""
+        now = time.monotonic()
+        if self.interval <= 0:
+            self._tokens = float(self.capacity)
+        else:
+            earned = (now - self._updated) / self.interval
+            self._tokens = min(float(self.capacity), self._tokens + earned)
+        self._updated = now
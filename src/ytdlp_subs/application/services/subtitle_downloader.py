@@ -1,15 +1,36 @@
 """Subtitle downloader service implementation."""
 
 import json
+import random
+import re
+import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
-from ytdlp_subs.domain.exceptions import CommandExecutionError, DownloadError, SubtitleNotFoundError
-from ytdlp_subs.domain.models import SubtitleFile, SubtitleFormat, SubtitleLanguage, VideoId
+from ytdlp_subs.domain.exceptions import (
+    CommandExecutionError,
+    DownloadError,
+    RateLimitError,
+    TransientDownloadError,
+)
+from ytdlp_subs.domain.models import (
+    SubtitleDownloadResult,
+    SubtitleFile,
+    SubtitleFormat,
+    SubtitleLanguage,
+    VideoId,
+)
 from ytdlp_subs.domain.services import ISubtitleDownloaderService
 from ytdlp_subs.infrastructure.command_executor import CommandExecutor
 from ytdlp_subs.infrastructure.logging import get_logger
+from ytdlp_subs.infrastructure.ytdlp import (
+    ANDROID_CLIENT_ARGS,
+    SUBTITLE_ONLY_ARGS,
+    build_base_command,
+    with_android_fallback,
+)
 
 logger = get_logger(__name__)
 
@@ -17,12 +38,57 @@ logger = get_logger(__name__)
 class YtDlpSubtitleDownloader(ISubtitleDownloaderService):
     """YT-DLP based subtitle downloader service."""
 
+    __slots__ = (
+        "command_executor",
+        "cookies_from_browser",
+        "js_runtimes",
+        "remote_components",
+        "sleep_subtitles",
+        "max_retries",
+        "retry_base_wait",
+        "_base_cmd",
+    )
+
+    # Pattern to extract per-video errors from yt-dlp stderr: ERROR: [extractor] videoID: message
+    BATCH_ERROR_PATTERN = re.compile(r"^ERROR: \[[^\]]+\] ([a-zA-Z0-9_-]{11}): (.*)$", re.MULTILINE)
+
+    # With --ignore-errors a failed subtitle fetch (e.g. a timedtext 429) is only
+    # a warning, while the printed info still lists the language as requested
+    SUBTITLE_WARNING_PATTERN = re.compile(
+        r"^WARNING: \[[^\]]+\] ([a-zA-Z0-9_-]{11}): (Unable to download video subtitles.*)$",
+        re.MULTILINE,
+    )
+
+    # yt-dlp error fragments that mean YouTube is throttling us
+    RATE_LIMIT_MARKERS = ("HTTP Error 429", "Too Many Requests", "rate limit", "quota")
+
+    # Server-provided delay before retrying a throttled request, when yt-dlp echoes it
+    RETRY_AFTER_PATTERN = re.compile(r"Retry-After:?\s*(\d+)", re.IGNORECASE)
+
+    # yt-dlp error fragments for server or network failures worth retrying
+    TRANSIENT_ERROR_MARKERS = (
+        "HTTP Error 5",
+        "timed out",
+        "Connection reset",
+        "Temporary failure in name resolution",
+    )
+
+    # Upper bound for the backoff between retries of transient failures
+    RETRY_MAX_WAIT_SECONDS = 60.0
+
+    # Print only the fields we use, once subtitles are written, instead of the
+    # full info dict (formats, thumbnails, captions) that --print-json emits
+    PRINT_TEMPLATE = "before_dl:%(.{id,title,requested_subtitles})j"
+
     def __init__(
         self,
         command_executor: CommandExecutor,
         cookies_from_browser: Optional[str] = None,
         js_runtimes: str = "node",
         remote_components: str = "ejs:github",
+        sleep_subtitles: int = 0,
+        max_retries: int = 2,
+        retry_base_wait: float = 1.0,
     ) -> None:
         """
         Initialize subtitle downloader.
@@ -32,11 +98,18 @@ class YtDlpSubtitleDownloader(ISubtitleDownloaderService):
             cookies_from_browser: Optional browser to extract cookies from
             js_runtimes: JS runtimes to use for yt-dlp challenges
             remote_components: Remote components to fetch
+            sleep_subtitles: Seconds yt-dlp sleeps before each subtitle download in a batch
+            max_retries: Extra attempts for videos that failed with a transient error
+            retry_base_wait: Backoff in seconds before the first retry, doubled on each retry
         """
         self.command_executor = command_executor
         self.cookies_from_browser = cookies_from_browser
         self.js_runtimes = js_runtimes
         self.remote_components = remote_components
+        self.sleep_subtitles = sleep_subtitles
+        self.max_retries = max_retries
+        self.retry_base_wait = retry_base_wait
+        self._base_cmd: list[str] = build_base_command(js_runtimes, remote_components, cookies_from_browser)
 
     def download_subtitle(
         self,
@@ -65,7 +138,7 @@ class YtDlpSubtitleDownloader(ISubtitleDownloaderService):
         )
 
         # Create temporary template for download
-        temp_template = output_dir / f"{video_id}_{language.value}.temp"
+        temp_template = output_dir / f"{video_id}.temp"
 
         command = self._build_download_command(
             video_id.url,
@@ -73,70 +146,47 @@ class YtDlpSubtitleDownloader(ISubtitleDownloaderService):
             str(temp_template),
         )
 
+        # Only the final JSON line matters; keep it instead of the whole stdout.
+        # Lines that are not a JSON object (warnings, notes) are skipped so
+        # trailing output does not hide the printed info.
+        last_line: deque[str] = deque(maxlen=1)
+
+        def keep_json(line: str) -> None:
+            if line.startswith("{"):
+                last_line.append(line)
+
         try:
-            result = self.command_executor.execute(command, check=True)
+            self.command_executor.execute_streaming(command, on_line=keep_json)
         except CommandExecutionError as e:
             logger.warning("Main subtitle download command failed. Retrying with Android client fallback...", video_id=str(video_id))
-            fallback_cmd = command[:-1] + ["--extractor-args", "youtube:player_client=android", command[-1]]
+            fallback_cmd = with_android_fallback(command)
+            last_line.clear()
             try:
-                result = self.command_executor.execute(fallback_cmd, check=True)
+                self.command_executor.execute_streaming(fallback_cmd, on_line=keep_json)
             except CommandExecutionError as fallback_e:
                 logger.error("Fallback subtitle download command failed", video_id=str(video_id), error=str(fallback_e))
-                raise DownloadError(
+                raise self._download_error(
                     f"Fallback subtitle download failed: {fallback_e.message}",
+                    fallback_e.context.get("stderr", ""),
                     video_id=str(video_id),
                     language=language.value,
                 ) from fallback_e
 
         try:
             # Parse JSON output to get subtitle info
-            json_output = result.stdout.strip().split("\n")[-1]
-            metadata = json.loads(json_output)
-
-            # Check if subtitle was actually downloaded
-            requested_subs = metadata.get("requested_subtitles")
-
-            # Handle case where requested_subtitles is None or language not available
-            if not requested_subs or language.value not in requested_subs:
-                logger.info(
-                    "Subtitle not available",
-                    video_id=str(video_id),
-                    language=language.value,
-                )
-                return None
-
-            # Find the downloaded file
-            subtitle_info = requested_subs[language.value]
-            ext = subtitle_info.get("ext", "vtt")
-            temp_file = output_dir / f"{video_id}_{language.value}.temp.{language.value}.{ext}"
+            metadata = json.loads(last_line[0] if last_line else "")
 
-            if not temp_file.exists():
-                logger.error(
-                    "Downloaded subtitle file not found",
-                    video_id=str(video_id),
-                    expected_path=str(temp_file),
-                )
-                raise DownloadError(
-                    f"Downloaded subtitle file not found: {temp_file}",
-                    video_id=str(video_id),
-                    language=language.value,
-                )
-
-            # Create SubtitleFile object
-            subtitle_file = SubtitleFile(
-                video_id=video_id,
-                language=language,
-                format=SubtitleFormat(ext),
-                file_path=temp_file,
-                size_bytes=temp_file.stat().st_size,
-                downloaded_at=datetime.now(),
+            subtitle_file = self._subtitle_file_from_metadata(
+                metadata, video_id, [language], output_dir
             )
+            if subtitle_file is None:
+                return None
 
             logger.info(
                 "Successfully downloaded subtitle",
                 video_id=str(video_id),
                 language=language.value,
-                file_path=str(temp_file),
+                file_path=str(subtitle_file.file_path),
                 size_bytes=subtitle_file.size_bytes,
             )
 
@@ -166,18 +216,307 @@ class YtDlpSubtitleDownloader(ISubtitleDownloaderService):
                 language=language.value,
             ) from e
 
+    def download_subtitles_batch(
+        self,
+        video_ids: list[VideoId],
+        languages: list[SubtitleLanguage],
+        output_dir: Path,
+        on_subtitle: Optional[Callable[[SubtitleFile], None]] = None,
+    ) -> dict[VideoId, SubtitleDownloadResult]:
+        """
+        Download subtitles for several videos with a single yt-dlp invocation.
+
+        Video URLs are fed to yt-dlp on stdin so the interpreter and extractor
+        start once per batch instead of once per video, and all preferred
+        languages are requested at once instead of one invocation per
+        language. Videos that fail are retried once with the Android client
+        fallback; videos that still fail with a transient error are retried
+        with exponential backoff.
+
+        Args:
+            video_ids: Video identifiers
+            languages: Subtitle languages in order of preference
+            output_dir: Directory to save subtitles
+            on_subtitle: Optional callback invoked with each subtitle as soon
+                as yt-dlp reports it, while the rest of the batch continues
+
+        Returns:
+            Mapping of every requested video ID to its download result
+        """
+        logger.info(
+            "Downloading subtitle batch",
+            count=len(video_ids),
+            languages=[language.value for language in languages],
+        )
+
+        results = self._run_batch(video_ids, languages, output_dir, on_subtitle=on_subtitle)
+
+        failed_ids = [vid for vid, result in results.items() if result.failed]
+        if failed_ids:
+            logger.warning(
+                "Batch subtitle download failed for some videos. Retrying with Android client fallback...",
+                count=len(failed_ids),
+            )
+            results.update(
+                self._run_batch(
+                    failed_ids,
+                    languages,
+                    output_dir,
+                    extra_args=ANDROID_CLIENT_ARGS,
+                    on_subtitle=on_subtitle,
+                )
+            )
+
+        for attempt in range(self.max_retries):
+            transient_ids = [
+                vid
+                for vid, result in results.items()
+                if isinstance(result.error, TransientDownloadError)
+            ]
+            if not transient_ids:
+                break
+
+            # Honour the longest Retry-After the server asked for, if any
+            retry_after = max(
+                (results[vid].error.context.get("retry_after", 0.0) for vid in transient_ids),
+                default=0.0,
+            )
+            wait_time = min(
+                self.RETRY_MAX_WAIT_SECONDS,
+                max(retry_after, self.retry_base_wait * 2**attempt + random.uniform(0, 2)),
+            )
+            logger.warning(
+                "Transient download failure. Retrying after backoff...",
+                count=len(transient_ids),
+                attempt=attempt + 1,
+                wait_seconds=f"{wait_time:.2f}",
+            )
+            time.sleep(wait_time)
+            results.update(
+                self._run_batch(transient_ids, languages, output_dir, on_subtitle=on_subtitle)
+            )
+
+        return results
+
+    def _run_batch(
+        self,
+        video_ids: list[VideoId],
+        languages: list[SubtitleLanguage],
+        output_dir: Path,
+        extra_args: Optional[list[str]] = None,
+        on_subtitle: Optional[Callable[[SubtitleFile], None]] = None,
+    ) -> dict[VideoId, SubtitleDownloadResult]:
+        """Run one yt-dlp batch invocation and collect per-video results."""
+        lang_codes = ",".join(language.value for language in languages)
+        temp_template = output_dir / "%(id)s.temp"
+        command = self._build_batch_download_command(lang_codes, str(temp_template))
+        if extra_args:
+            command.extend(extra_args)
+
+        urls = "\n".join(video_id.url for video_id in video_ids) + "\n"
+
+        # The executor timeout is meant for one video; a batch gets it per video
+        timeout = self.command_executor.timeout
+        if timeout is not None:
+            timeout = (timeout + self.sleep_subtitles) * len(video_ids)
+
+        results: dict[VideoId, SubtitleDownloadResult] = {}
+        requested = {str(video_id): video_id for video_id in video_ids}
+        # Videos whose subtitle file is missing; stderr may explain why
+        missing_files: list[VideoId] = []
+
+        def handle_line(line: str) -> None:
+            # Parse each video's JSON as soon as yt-dlp prints it
+            if not line.startswith("{"):
+                return
+
+            try:
+                metadata = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning("Skipping unparsable batch output line")
+                return
+
+            video_id = requested.get(metadata.get("id", ""))
+            if video_id is None:
+                return
+
+            try:
+                subtitle_file = self._subtitle_file_from_metadata(
+                    metadata, video_id, languages, output_dir
+                )
+                results[video_id] = SubtitleDownloadResult(
+                    video_id=video_id, subtitle_file=subtitle_file
+                )
+            except DownloadError as e:
+                results[video_id] = SubtitleDownloadResult(video_id=video_id, error=e)
+                if isinstance(e.__cause__, FileNotFoundError):
+                    missing_files.append(video_id)
+                return
+
+            if subtitle_file is not None and on_subtitle is not None:
+                on_subtitle(subtitle_file)
+
+        try:
+            result = self.command_executor.execute_streaming(
+                command, on_line=handle_line, check=False, input_text=urls, timeout=timeout
+            )
+        except CommandExecutionError as e:
+            logger.error("Batch subtitle download command failed", error=str(e))
+            # Videos yt-dlp already reported keep their results (and may have
+            # been handed to on_subtitle); only the rest of the batch failed.
+            # A timed-out batch may well succeed on the next attempt.
+            error_type = TransientDownloadError if "timeout" in e.context else DownloadError
+            for video_id in video_ids:
+                if video_id not in results:
+                    results[video_id] = SubtitleDownloadResult(
+                        video_id=video_id,
+                        error=error_type(
+                            f"Batch subtitle download failed: {e.message}",
+                            video_id=str(video_id),
+                            languages=lang_codes,
+                        ),
+                    )
+            return results
+
+        errors = dict(self.BATCH_ERROR_PATTERN.findall(result.stderr or ""))
+
+        # Classify missing files by the warning yt-dlp gave for the fetch, so a
+        # throttled or failed request is retried instead of logged as permanent
+        warnings: dict[str, list[str]] = {}
+        for warned_id, warning in self.SUBTITLE_WARNING_PATTERN.findall(result.stderr or ""):
+            warnings.setdefault(warned_id, []).append(warning)
+
+        for video_id in missing_files:
+            warning = "\n".join(warnings.get(str(video_id), ()))
+            if not warning:
+                continue
+            logger.error("Subtitle fetch failed in batch", video_id=str(video_id), error=warning)
+            results[video_id] = SubtitleDownloadResult(
+                video_id=video_id,
+                error=self._download_error(
+                    f"Failed to download subtitle: {warning}",
+                    warning,
+                    video_id=str(video_id),
+                    languages=lang_codes,
+                ),
+            )
+
+        for video_id in video_ids:
+            if video_id in results:
+                continue
+            message = errors.get(str(video_id), "yt-dlp produced no output for video")
+            logger.error(
+                "Subtitle download failed in batch",
+                video_id=str(video_id),
+                error=message,
+            )
+            results[video_id] = SubtitleDownloadResult(
+                video_id=video_id,
+                error=self._download_error(
+                    f"Failed to download subtitle: {message}",
+                    message,
+                    video_id=str(video_id),
+                    languages=lang_codes,
+                ),
+            )
+
+        return results
+
+    def _download_error(self, message: str, stderr: str, **context: str) -> DownloadError:
+        """Create a DownloadError subclass matching the failure reported by yt-dlp."""
+        if any(marker in stderr for marker in self.RATE_LIMIT_MARKERS):
+            retry_after = self.RETRY_AFTER_PATTERN.search(stderr)
+            if retry_after:
+                return RateLimitError(message, retry_after=float(retry_after.group(1)), **context)
+            return RateLimitError(message, **context)
+        if any(marker in stderr for marker in self.TRANSIENT_ERROR_MARKERS):
+            return TransientDownloadError(message, **context)
+        return DownloadError(message, **context)
+
+    def _subtitle_file_from_metadata(
+        self,
+        metadata: dict[str, Any],
+        video_id: VideoId,
+        languages: list[SubtitleLanguage],
+        output_dir: Path,
+    ) -> Optional[SubtitleFile]:
+        """
+        Build SubtitleFile for the most preferred language yt-dlp wrote, or None if none is.
+
+        Files written for less preferred languages are removed.
+        """
+        requested_subs = metadata.get("requested_subtitles") or {}
+        language = next((lang for lang in languages if lang.value in requested_subs), None)
+
+        if language is None:
+            logger.info(
+                "Subtitle not available",
+                video_id=str(video_id),
+                languages=[lang.value for lang in languages],
+            )
+            return None
+
+        for lang_code, requested_sub in requested_subs.items():
+            if lang_code != language.value:
+                self._temp_subtitle_path(requested_sub, video_id, lang_code, output_dir).unlink(
+                    missing_ok=True
+                )
+
+        requested_sub = requested_subs[language.value]
+        ext = requested_sub.get("ext", "vtt")
+        try:
+            subtitle_format = SubtitleFormat(ext)
+        except ValueError as e:
+            raise DownloadError(
+                f"Unsupported subtitle format: {ext}",
+                video_id=str(video_id),
+                language=language.value,
+            ) from e
+        temp_file = self._temp_subtitle_path(requested_sub, video_id, language.value, output_dir)
+
+        # A single stat proves the file exists and gives its size and the
+        # time yt-dlp wrote it, so no separate clock read is needed
+        try:
+            stat_result = temp_file.stat()
+        except FileNotFoundError as e:
+            logger.error(
+                "Downloaded subtitle file not found",
+                video_id=str(video_id),
+                expected_path=str(temp_file),
+            )
+            raise DownloadError(
+                f"Downloaded subtitle file not found: {temp_file}",
+                video_id=str(video_id),
+                language=language.value,
+            ) from e
+
+        return SubtitleFile(
+            video_id=video_id,
+            language=language,
+            format=subtitle_format,
+            file_path=temp_file,
+            size_bytes=stat_result.st_size,
+            downloaded_at=datetime.fromtimestamp(stat_result.st_mtime),
+            title=metadata.get("title"),
+        )
+
+    def _temp_subtitle_path(
+        self,
+        requested_sub: dict[str, Any],
+        video_id: VideoId,
+        lang_code: str,
+        output_dir: Path,
+    ) -> Path:
+        """Path yt-dlp wrote a subtitle to, derived from the output template if not reported."""
+        filepath = requested_sub.get("filepath")
+        if filepath:
+            return Path(filepath)
+        ext = requested_sub.get("ext", "vtt")
+        return output_dir / f"{video_id}.temp.{lang_code}.{ext}"
+
     def _build_base_cmd(self) -> list[str]:
-        """Build the base yt-dlp command with common anti-bot options."""
-        cmd = [
-            "yt-dlp",
-            "--js-runtimes", self.js_runtimes,
-            "--remote-components", self.remote_components,
-        ]
-        
-        if self.cookies_from_browser:
-            cmd.extend(["--cookies-from-browser", self.cookies_from_browser])
-            
-        return cmd
+        """Return a fresh copy of the base yt-dlp command with common anti-bot options."""
+        return self._base_cmd.copy()
 
     def _build_download_command(
         self,
@@ -191,10 +530,35 @@ class YtDlpSubtitleDownloader(ISubtitleDownloaderService):
             "--write-auto-sub",
             "--sub-lang",
             language,
-            "--skip-download",
+            *SUBTITLE_ONLY_ARGS,
             "--output",
             temp_template,
-            "--print-json",
+            "--print",
+            self.PRINT_TEMPLATE,
             video_url
         ])
         return command
+
+    def _build_batch_download_command(
+        self,
+        languages: str,
+        temp_template: str,
+    ) -> list[str]:
+        """Build yt-dlp command that reads video URLs from stdin."""
+        command = self._build_base_cmd()
+        command.extend([
+            "--write-auto-sub",
+            "--sub-langs",
+            languages,
+            *SUBTITLE_ONLY_ARGS,
+            "--ignore-errors",
+            "--sleep-subtitles",
+            str(self.sleep_subtitles),
+            "--output",
+            temp_template,
+            "--print",
+            self.PRINT_TEMPLATE,
+            "--batch-file",
+            "-",
+        ])
+        return command
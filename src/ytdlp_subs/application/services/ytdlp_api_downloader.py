@@ -0,0 +1,180 @@
+"""Subtitle downloader service that runs yt-dlp in-process."""
+
+import atexit
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import yt_dlp
+from yt_dlp import YoutubeDL
+
+from ytdlp_subs.application.services.subtitle_downloader import YtDlpSubtitleDownloader
+from ytdlp_subs.domain.exceptions import DownloadError
+from ytdlp_subs.domain.models import (
+    SubtitleDownloadResult,
+    SubtitleFile,
+    SubtitleLanguage,
+    VideoId,
+)
+from ytdlp_subs.infrastructure.logging import get_logger
+from ytdlp_subs.infrastructure.ytdlp import SUBTITLE_ONLY_ARGS
+
+logger = get_logger(__name__)
+
+
+class _YtDlpLogger:
+    """Route yt-dlp's own console messages into structured logging."""
+
+    def debug(self, msg: str) -> None:
+        logger.debug("yt-dlp", message=msg)
+
+    def info(self, msg: str) -> None:
+        logger.debug("yt-dlp", message=msg)
+
+    def warning(self, msg: str) -> None:
+        logger.warning("yt-dlp warning", message=msg)
+
+    def error(self, msg: str) -> None:
+        # Errors are also raised as exceptions and reported per video
+        logger.debug("yt-dlp error", message=msg)
+
+
+class YtDlpApiSubtitleDownloader(YtDlpSubtitleDownloader):
+    """
+    YT-DLP subtitle downloader driving yt-dlp through its Python API.
+
+    Avoids spawning a yt-dlp process (and re-importing yt-dlp) per batch and
+    reads each video's info dict directly instead of parsing printed JSON.
+    Retries, fallbacks and result mapping are shared with the subprocess
+    based downloader.
+    """
+
+    __slots__ = ("_idle_ydls", "_idle_lock")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the downloader.
+
+        Args:
+            *args: Positional arguments of YtDlpSubtitleDownloader
+            **kwargs: Keyword arguments of YtDlpSubtitleDownloader
+        """
+        super().__init__(*args, **kwargs)
+        # Idle YoutubeDL instances per option set, reused by later batches so
+        # HTTP connections, cookies and extractor state carry over. Each
+        # instance serves one worker at a time.
+        self._idle_ydls: dict[tuple[str, str, tuple[str, ...]], list[YoutubeDL]] = {}
+        self._idle_lock = threading.Lock()
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """Close every idle YoutubeDL instance."""
+        with self._idle_lock:
+            idle = [ydl for ydls in self._idle_ydls.values() for ydl in ydls]
+            self._idle_ydls.clear()
+        for ydl in idle:
+            ydl.close()
+
+    def _run_batch(
+        self,
+        video_ids: list[VideoId],
+        languages: list[SubtitleLanguage],
+        output_dir: Path,
+        extra_args: Optional[list[str]] = None,
+        on_subtitle: Optional[Callable[[SubtitleFile], None]] = None,
+    ) -> dict[VideoId, SubtitleDownloadResult]:
+        """Download a batch with one in-process YoutubeDL instance."""
+        lang_codes = ",".join(language.value for language in languages)
+        temp_template = str(output_dir / "%(id)s.temp")
+        key = (lang_codes, temp_template, tuple(extra_args or ()))
+        results: dict[VideoId, SubtitleDownloadResult] = {}
+
+        ydl = self._acquire_ydl(key)
+        try:
+            for video_id in video_ids:
+                try:
+                    info = ydl.extract_info(video_id.url, download=True)
+                    subtitle_file = self._subtitle_file_from_metadata(
+                        info, video_id, languages, output_dir
+                    )
+                except DownloadError as e:
+                    results[video_id] = SubtitleDownloadResult(video_id=video_id, error=e)
+                    continue
+                except Exception as e:
+                    # yt_dlp.utils.DownloadError and unexpected extractor failures
+                    message = str(e)
+                    logger.error(
+                        "Subtitle download failed in batch",
+                        video_id=str(video_id),
+                        error=message,
+                    )
+                    results[video_id] = SubtitleDownloadResult(
+                        video_id=video_id,
+                        error=self._download_error(
+                            f"Failed to download subtitle: {message}",
+                            message,
+                            video_id=str(video_id),
+                            languages=lang_codes,
+                        ),
+                    )
+                    continue
+
+                results[video_id] = SubtitleDownloadResult(
+                    video_id=video_id, subtitle_file=subtitle_file
+                )
+                if subtitle_file is not None and on_subtitle is not None:
+                    on_subtitle(subtitle_file)
+        finally:
+            with self._idle_lock:
+                self._idle_ydls.setdefault(key, []).append(ydl)
+
+        return results
+
+    def _acquire_ydl(self, key: tuple[str, str, tuple[str, ...]]) -> YoutubeDL:
+        """
+        Take an idle YoutubeDL instance for an option set, creating one if none is free.
+
+        Args:
+            key: Language codes, output template and extra CLI arguments
+
+        Returns:
+            YoutubeDL instance reserved for the caller
+        """
+        with self._idle_lock:
+            idle = self._idle_ydls.get(key)
+            if idle:
+                return idle.pop()
+
+        lang_codes, temp_template, extra_args = key
+        return YoutubeDL(self._build_ydl_opts(lang_codes, temp_template, list(extra_args)))
+
+    def _build_ydl_opts(
+        self,
+        lang_codes: str,
+        temp_template: str,
+        extra_args: Optional[list[str]] = None,
+    ) -> dict[str, Any]:
+        """Translate the CLI options used by the subprocess downloader into YoutubeDL params."""
+        args = self._build_base_cmd()[1:]
+        args.extend([
+            "--write-auto-sub",
+            "--sub-langs",
+            lang_codes,
+            *SUBTITLE_ONLY_ARGS,
+            "--sleep-subtitles",
+            str(self.sleep_subtitles),
+            "--output",
+            temp_template,
+        ])
+        if extra_args:
+            args.extend(extra_args)
+
+        opts: dict[str, Any] = yt_dlp.parse_options(args).ydl_opts
+        opts.update(
+            quiet=True,
+            no_warnings=False,
+            noprogress=True,
+            ignoreerrors=False,
+            logger=_YtDlpLogger(),
+        )
+        return opts
@@ -1,12 +1,20 @@
 """Download orchestrator use case - coordinates the entire download process."""
 
-import random
-import time
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from itertools import chain, filterfalse, islice
+from operator import attrgetter
+from pathlib import Path
 from typing import Callable, Optional
 
-from ytdlp_subs.domain.exceptions import DownloadError
+from ytdlp_subs.application.services.backpressure import BackpressureController
+from ytdlp_subs.application.services.rate_limiter import TokenBucket
+from ytdlp_subs.domain.exceptions import RateLimitError
 from ytdlp_subs.domain.models import (
     DownloadProgress,
+    SubtitleFile,
     SubtitleFormat,
     SubtitleLanguage,
     VideoId,
@@ -27,6 +35,8 @@ from ytdlp_subs.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+_ID_VALUE = attrgetter("value")
+
 
 class DownloadOrchestrator:
     """
@@ -36,6 +46,9 @@ class DownloadOrchestrator:
     to download subtitles from a YouTube channel.
     """
 
+    # Channels whose video IDs are kept in memory, least recently used evicted first
+    CHANNEL_CACHE_SIZE = 8
+
     def __init__(
         self,
         video_repository: IVideoRepository,
@@ -50,6 +63,8 @@ class DownloadOrchestrator:
         max_wait_seconds: float = 15.0,
         output_format: Optional[SubtitleFormat] = None,
         force_refresh: bool = False,
+        batch_size: int = 50,
+        concurrency: int = 1,
         progress_callback: Optional[Callable[[DownloadProgress], None]] = None,
     ) -> None:
         """
@@ -68,6 +83,8 @@ class DownloadOrchestrator:
             max_wait_seconds: Maximum wait time between downloads
             output_format: Optional output format for processing
             force_refresh: Whether to force refresh cache
+            batch_size: Number of videos handed to a single yt-dlp invocation
+            concurrency: Maximum number of batches downloaded simultaneously
             progress_callback: Optional callback for progress updates
         """
         self.video_repository = video_repository
@@ -82,9 +99,27 @@ class DownloadOrchestrator:
         self.max_wait_seconds = max_wait_seconds
         self.output_format = output_format
         self.force_refresh = force_refresh
+        self.batch_size = batch_size
+        self.concurrency = concurrency
         self.progress_callback = progress_callback
-
-    def execute(self, channel_url: str, output_dir) -> DownloadProgress:
+        self._progress_lock = threading.Lock()
+        self._channel_video_ids: OrderedDict[str, list[VideoId]] = OrderedDict()
+        self.backpressure = BackpressureController(
+            min_wait=min_wait_seconds,
+            max_wait=max_wait_seconds,
+        )
+        self._rate_limiter = TokenBucket(interval=min_wait_seconds, capacity=concurrency)
+        # Cache writes run here so downloads start without waiting on disk;
+        # started on first use and again after close()
+        self._cache_writer: Optional[ThreadPoolExecutor] = None
+
+    def close(self) -> None:
+        """Wait for pending cache writes to finish."""
+        if self._cache_writer is not None:
+            self._cache_writer.shutdown(wait=True)
+            self._cache_writer = None
+
+    def execute(self, channel_url: str, output_dir: Path) -> DownloadProgress:
         """
         Execute the download process for a channel.
 
@@ -109,19 +144,25 @@ class DownloadOrchestrator:
                 failed_videos=0,
             )
 
-        # Get already downloaded and failed video IDs
+        # Get already downloaded and failed video IDs as one frozen set of
+        # plain strings: str caches its hash, while the VideoId dataclass
+        # recomputes it in Python on every lookup
         downloaded_ids = self.subtitle_repository.get_downloaded_video_ids()
         failed_ids = self.error_repository.get_failed_video_ids()
-        skipped_ids = downloaded_ids | failed_ids
+        skipped_ids = frozenset(map(_ID_VALUE, chain(downloaded_ids, failed_ids)))
 
-        # Filter out already downloaded and failed videos
-        videos_to_download = [vid for vid in all_video_ids if vid not in skipped_ids]
+        # Drop duplicate IDs but keep channel order, keyed by the ID string.
+        # Count the pending videos with a C-level set intersection instead of
+        # building a filtered list.
+        unique_ids = dict(zip(map(_ID_VALUE, all_video_ids), all_video_ids, strict=True))
+        skipped_count = len(skipped_ids.intersection(unique_ids))
+        pending_count = len(unique_ids) - skipped_count
 
         # Initialize progress
         progress = DownloadProgress(
             total_videos=len(all_video_ids),
             processed_videos=0,
-            skipped_videos=len(skipped_ids),
+            skipped_videos=skipped_count,
             failed_videos=0,
         )
 
@@ -129,47 +170,50 @@ class DownloadOrchestrator:
             "Download plan",
             total_videos=progress.total_videos,
             already_downloaded=progress.skipped_videos,
-            to_download=len(videos_to_download),
+            to_download=pending_count,
         )
 
-        if not videos_to_download:
+        if not pending_count:
             logger.info("All videos already downloaded")
             return progress
 
-        # Process each video
-        for idx, video_id in enumerate(videos_to_download, start=1):
-            progress.current_video = video_id
+        # Process videos in batches so yt-dlp starts once per batch, not per
+        # video. Shrink batches when there are too few videos to give every
+        # worker at least one batch. Batches are cut straight from the
+        # filtered stream.
+        batch_size = min(self.batch_size, -(-pending_count // self.concurrency))
+        pending = map(unique_ids.__getitem__, filterfalse(skipped_ids.__contains__, unique_ids))
+        batches = iter(lambda: list(islice(pending, batch_size)), [])
+
+        # Every worker may start its first batch at once; after that batches
+        # are released at the backpressure-controlled rate across all workers
+        self._rate_limiter = TokenBucket(
+            interval=self.backpressure.current_wait / self.concurrency,
+            capacity=self.concurrency,
+        )
 
-            try:
-                self._process_video(
-                    video_id=video_id,
+        # Download batches concurrently, bounded by the worker pool size
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [
+                executor.submit(
+                    self._run_batch_task,
+                    batch=batch,
                     output_dir=output_dir,
-                    current_index=idx + progress.skipped_videos,
-                    total_count=progress.total_videos,
+                    first_index=batch_idx * batch_size + 1 + progress.skipped_videos,
+                    progress=progress,
                 )
+                for batch_idx, batch in enumerate(batches)
+            ]
 
-                progress.processed_videos += 1
-
-            except Exception as e:
-                logger.error(
-                    "Failed to process video",
-                    video_id=str(video_id),
-                    error=str(e),
-                )
-                self.error_repository.record_error(
-                    video_id=video_id,
-                    error_type=e.__class__.__name__,
-                    error_message=str(e),
-                )
-                progress.failed_videos += 1
-
-            # Report progress
-            if self.progress_callback:
-                self.progress_callback(progress)
-
-            # Wait between downloads (except for last video)
-            if idx < len(videos_to_download):
-                self._wait_random_time()
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            finally:
+                self.subtitle_repository.flush()
+                self.error_repository.flush()
 
         logger.info(
             "Download process completed",
@@ -184,115 +228,246 @@ class DownloadOrchestrator:
 
     def _get_channel_videos(self, channel_url: str) -> list[VideoId]:
         """Get channel videos with caching support."""
-        # Try cache first if not forcing refresh
+        # Try memory, then the cache, unless forcing refresh
         if not self.force_refresh:
+            # Repeated runs in the same process reuse the IDs already loaded
+            loaded_ids = self._channel_video_ids.get(channel_url)
+            if loaded_ids is not None:
+                logger.info("Using video IDs loaded earlier in this process", count=len(loaded_ids))
+                self._channel_video_ids.move_to_end(channel_url)
+                return loaded_ids
+
             cached_ids = self.cache_repository.get_cached_video_ids()
             if cached_ids:
                 logger.info("Using cached video IDs", count=len(cached_ids))
+                self._remember_channel_videos(channel_url, cached_ids)
                 return cached_ids
 
         # Fetch from network
         logger.info("Fetching video IDs from network")
         video_ids = self.video_repository.get_channel_video_ids(channel_url)
 
-        # Save to cache
-        self.cache_repository.save_video_ids(video_ids)
+        # Save to cache in the background; the IDs are already in memory
+        if self._cache_writer is None:
+            self._cache_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache")
+        self._cache_writer.submit(self.cache_repository.save_video_ids, video_ids).add_done_callback(
+            self._log_cache_error
+        )
+        self._remember_channel_videos(channel_url, video_ids)
 
         return video_ids
 
-    def _process_video(
+    def _remember_channel_videos(self, channel_url: str, video_ids: list[VideoId]) -> None:
+        """Keep a channel's video IDs in memory, evicting the least recently used channel."""
+        self._channel_video_ids[channel_url] = video_ids
+        self._channel_video_ids.move_to_end(channel_url)
+        if len(self._channel_video_ids) > self.CHANNEL_CACHE_SIZE:
+            self._channel_video_ids.popitem(last=False)
+
+    @staticmethod
+    def _log_cache_error(future: Future[None]) -> None:
+        """Log a failed background cache write; the run itself is unaffected."""
+        error = future.exception()
+        if error is not None:
+            logger.warning("Failed to save video IDs to cache", error=str(error))
+
+    def _run_batch_task(
         self,
-        video_id: VideoId,
-        output_dir,
-        current_index: int,
-        total_count: int,
+        batch: list[VideoId],
+        output_dir: Path,
+        first_index: int,
+        progress: DownloadProgress,
     ) -> None:
-        """Process a single video."""
-        logger.info(
-            "Processing video",
-            video_id=str(video_id),
-            index=current_index,
-            total=total_count,
+        """Worker entry point: pace the request, then process the batch."""
+        self._rate_limiter.acquire()
+
+        self._process_batch(
+            batch=batch,
+            output_dir=output_dir,
+            first_index=first_index,
+            progress=progress,
         )
 
-        # Try each language preference
-        for language in self.language_preferences:
-            logger.debug(
-                "Attempting language",
-                video_id=str(video_id),
-                language=language.value,
-            )
+        # The batch's files are in place now; index them and push buffered
+        # errors to disk once per batch
+        self.subtitle_repository.flush()
+        self.error_repository.flush()
 
-            subtitle_file = self.subtitle_downloader.download_subtitle(
-                video_id=video_id,
+    def _process_batch(
+        self,
+        batch: list[VideoId],
+        output_dir: Path,
+        first_index: int,
+        progress: DownloadProgress,
+    ) -> None:
+        """Download and finalize subtitles for a batch of videos."""
+        indexes = {video_id: first_index + offset for offset, video_id in enumerate(batch)}
+        finalized: set[VideoId] = set()
+        # Appended only from the finalizer thread, saved in one call per batch
+        saved: list[SubtitleFile] = []
+
+        # Finalizing (metadata lookup, rename, post-processing) runs on its own
+        # thread so the downloader keeps reading yt-dlp output meanwhile
+        try:
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="finalize") as finalizer:
+
+                def finalize(subtitle_file: SubtitleFile) -> None:
+                    finalized.add(subtitle_file.video_id)
+                    finalizer.submit(
+                        self._finalize_and_record,
+                        subtitle_file=subtitle_file,
+                        saved=saved,
+                        language=subtitle_file.language,
+                        output_dir=output_dir,
+                        current_index=indexes[subtitle_file.video_id],
+                        progress=progress,
+                    )
+
+                # One invocation requests every language preference; the downloader
+                # keeps the most preferred one available for each video
+                results = self.subtitle_downloader.download_subtitles_batch(
+                    video_ids=batch,
+                    languages=self.language_preferences,
+                    output_dir=output_dir,
+                    on_subtitle=finalize,
+                )
+
+                if any(isinstance(result.error, RateLimitError) for result in results.values()):
+                    self.backpressure.on_throttle()
+                else:
+                    self.backpressure.on_success()
+                self._rate_limiter.set_interval(self.backpressure.current_wait / self.concurrency)
+
+                for video_id in batch:
+                    result = results[video_id]
+
+                    if video_id in finalized:
+                        continue
+                    elif result.failed:
+                        self._record_failure(video_id, result.error, progress)
+                    elif result.subtitle_file is None:
+                        logger.warning(
+                            "No subtitles found in any preferred language",
+                            video_id=str(video_id),
+                            languages=[lang.value for lang in self.language_preferences],
+                        )
+                        self._record_success(video_id, progress)
+                    else:
+                        finalize(result.subtitle_file)
+        finally:
+            # The finalizer has drained here, so every finalized subtitle is in the list
+            self.subtitle_repository.save_subtitles(saved)
+
+    def _finalize_and_record(
+        self,
+        subtitle_file: SubtitleFile,
+        saved: list[SubtitleFile],
+        language: SubtitleLanguage,
+        output_dir: Path,
+        current_index: int,
+        progress: DownloadProgress,
+    ) -> None:
+        """Finalize a downloaded subtitle and count the video as processed or failed."""
+        try:
+            self._finalize_subtitle(
+                subtitle_file=subtitle_file,
                 language=language,
                 output_dir=output_dir,
+                current_index=current_index,
+                total_count=progress.total_videos,
             )
+            saved.append(subtitle_file)
+            self._record_success(subtitle_file.video_id, progress)
+        except Exception as e:
+            self._record_failure(subtitle_file.video_id, e, progress)
 
-            if subtitle_file is None:
-                logger.debug(
-                    "Subtitle not available",
-                    video_id=str(video_id),
-                    language=language.value,
-                )
-                continue
-
-            # Get video metadata for filename generation
+    def _finalize_subtitle(
+        self,
+        subtitle_file: SubtitleFile,
+        language: SubtitleLanguage,
+        output_dir: Path,
+        current_index: int,
+        total_count: int,
+    ) -> None:
+        """Rename and post-process a downloaded subtitle."""
+        video_id = subtitle_file.video_id
+
+        # yt-dlp reports the title while downloading; only look up metadata
+        # (another yt-dlp run) when it did not
+        if subtitle_file.title is not None:
+            metadata = VideoMetadata(video_id=video_id, title=subtitle_file.title)
+        else:
             metadata = self.video_repository.get_video_metadata(video_id)
             if metadata is None:
                 metadata = VideoMetadata(video_id=video_id, title="UnknownTitle")
 
-            # Generate final filename
-            final_filename = self.filename_generator.generate_filename(
-                video_metadata=metadata,
-                language=language,
-                format=subtitle_file.format,
-                index=current_index,
-                total_count=total_count,
-            )
+        # Generate final filename
+        final_filename = self.filename_generator.generate_filename(
+            video_metadata=metadata,
+            language=language,
+            format=subtitle_file.format,
+            index=current_index,
+            total_count=total_count,
+        )
 
-            final_path = output_dir / final_filename
+        final_path = output_dir / final_filename
 
-            # Rename file
-            subtitle_file.file_path.rename(final_path)
+        # Rename file; os.replace also overwrites a leftover target on Windows
+        if subtitle_file.file_path != final_path:
+            os.replace(subtitle_file.file_path, final_path)
             subtitle_file.file_path = final_path
 
-            logger.info(
-                "Renamed subtitle file",
-                video_id=str(video_id),
-                filename=final_filename,
-            )
-
-            # Process file if needed
-            if self.output_format:
-                processed_path = self.file_processor.process_file(
-                    input_file=final_path,
-                    output_format=self.output_format,
-                )
-                subtitle_file.file_path = processed_path
-
-            # Save to repository
-            self.subtitle_repository.save_subtitle(subtitle_file)
+        logger.info(
+            "Renamed subtitle file",
+            video_id=str(video_id),
+            filename=final_filename,
+        )
 
-            logger.info(
-                "Successfully processed video",
-                video_id=str(video_id),
-                language=language.value,
-                final_path=str(subtitle_file.file_path),
+        # Process file if needed
+        if self.output_format:
+            processed_path = self.file_processor.process_file(
+                input_file=final_path,
+                output_format=self.output_format,
             )
+            subtitle_file.file_path = processed_path
+
+        logger.info(
+            "Successfully processed video",
+            video_id=str(video_id),
+            language=language.value,
+            final_path=str(subtitle_file.file_path),
+        )
 
-            # Success - don't try other languages
-            return
+    def _record_success(self, video_id: VideoId, progress: DownloadProgress) -> None:
+        """Count a processed video and report progress."""
+        with self._progress_lock:
+            progress.current_video = video_id
+            progress.processed_videos += 1
+            self._report_progress(progress)
 
-        # If we get here, no subtitle was found in any language
-        logger.warning(
-            "No subtitles found in any preferred language",
+    def _record_failure(
+        self,
+        video_id: VideoId,
+        error: Exception,
+        progress: DownloadProgress,
+    ) -> None:
+        """Log and persist a failed video, then report progress."""
+        logger.error(
+            "Failed to process video",
             video_id=str(video_id),
-            languages=[lang.value for lang in self.language_preferences],
+            error=str(error),
         )
+        with self._progress_lock:
+            self.error_repository.record_error(
+                video_id=video_id,
+                error_type=error.__class__.__name__,
+                error_message=str(error),
+            )
+            progress.current_video = video_id
+            progress.failed_videos += 1
+            self._report_progress(progress)
 
-    def _wait_random_time(self) -> None:
-        """Wait a random time between min and max wait seconds."""
-        wait_time = random.uniform(self.min_wait_seconds, self.max_wait_seconds)
-        logger.debug("Waiting between downloads", wait_seconds=f"{wait_time:.2f}")
-        time.sleep(wait_time)
+    def _report_progress(self, progress: DownloadProgress) -> None:
+        """Invoke the progress callback if one is registered (caller holds the lock)."""
+        if self.progress_callback:
+            self.progress_callback(progress)
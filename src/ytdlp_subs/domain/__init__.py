@@ -6,14 +6,17 @@ from ytdlp_subs.domain.exceptions import (
     ConfigurationError,
     DownloadError,
     FileProcessingError,
+    RateLimitError,
     SubtitleDownloaderError,
     SubtitleNotFoundError,
+    TransientDownloadError,
     ValidationError,
     VideoFetchError,
 )
 from ytdlp_subs.domain.models import (
     ChannelUrl,
     DownloadProgress,
+    SubtitleDownloadResult,
     SubtitleFile,
     SubtitleFormat,
     SubtitleLanguage,
@@ -27,6 +30,8 @@ __all__ = [
     "VideoFetchError",
     "SubtitleNotFoundError",
     "DownloadError",
+    "TransientDownloadError",
+    "RateLimitError",
     "FileProcessingError",
     "ConfigurationError",
     "CacheError",
@@ -37,6 +42,7 @@ __all__ = [
     "ChannelUrl",
     "VideoMetadata",
     "SubtitleFile",
+    "SubtitleDownloadResult",
     "SubtitleFormat",
     "SubtitleLanguage",
     "DownloadProgress",
@@ -37,6 +37,18 @@ class DownloadError(SubtitleDownloaderError):
     pass
 
 
+class TransientDownloadError(DownloadError):
+    """Raised when subtitle download fails for a reason that may clear up on retry."""
+
+    pass
+
+
+class RateLimitError(TransientDownloadError):
+    """Raised when YouTube throttles requests (e.g. HTTP 429)."""
+
+    pass
+
+
 class FileProcessingError(SubtitleDownloaderError):
     """Raised when file processing fails."""
 
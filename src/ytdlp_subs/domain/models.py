@@ -1,10 +1,13 @@
 """Domain models for the subtitle downloader."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Optional, cast
+
+from ytdlp_subs.domain.exceptions import DownloadError
 
 
 class SubtitleFormat(str, Enum):
@@ -27,6 +30,21 @@ class SubtitleLanguage(str, Enum):
     KOREAN = "ko"
     CHINESE = "zh"
 
+    @classmethod
+    def lookup(cls, lang: str) -> Optional["SubtitleLanguage"]:
+        """
+        Find the SubtitleLanguage for a code without raising.
+
+        Args:
+            lang: Language code string
+
+        Returns:
+            SubtitleLanguage enum value, or None if the code is not supported
+        """
+        # Direct lookup in the enum's value map; avoids the EnumMeta call path
+        # and exception handling for unsupported codes
+        return cast(Optional["SubtitleLanguage"], cls._value2member_map_.get(lang.lower()))
+
     @classmethod
     def from_string(cls, lang: str) -> "SubtitleLanguage":
         """
@@ -41,23 +59,29 @@ class SubtitleLanguage(str, Enum):
         Raises:
             ValueError: If language code is not supported
         """
-        try:
-            return cls(lang.lower())
-        except ValueError as e:
-            raise ValueError(f"Unsupported language code: {lang}") from e
+        member = cls.lookup(lang)
+        if member is None:
+            raise ValueError(f"Unsupported language code: {lang}")
+        return member
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VideoId:
     """Value object representing a YouTube video ID."""
 
     value: str
+    _url: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate video ID format."""
+        """Validate video ID format and precompute the watch URL."""
         if not self.value or len(self.value) != 11:
             raise ValueError(f"Invalid YouTube video ID: {self.value}")
 
+        # Interned IDs share one string per value across the cache, index and
+        # error log, so equal IDs compare by identity in set lookups
+        object.__setattr__(self, "value", sys.intern(self.value))
+        object.__setattr__(self, "_url", f"https://www.youtube.com/watch?v={self.value}")
+
     def __str__(self) -> str:
         """Return string representation."""
         return self.value
@@ -65,10 +89,10 @@ class VideoId:
     @property
     def url(self) -> str:
         """Get full YouTube URL for this video."""
-        return f"https://www.youtube.com/watch?v={self.value}"
+        return self._url
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChannelUrl:
     """Value object representing a YouTube channel URL."""
 
@@ -84,7 +108,7 @@ class ChannelUrl:
         return self.value
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoMetadata:
     """Entity representing video metadata."""
 
@@ -110,7 +134,7 @@ class VideoMetadata:
         return language in self.available_subtitles
 
 
-@dataclass
+@dataclass(slots=True)
 class SubtitleFile:
     """Entity representing a downloaded subtitle file."""
 
@@ -120,6 +144,7 @@ class SubtitleFile:
     file_path: Path
     size_bytes: int
     downloaded_at: datetime = field(default_factory=datetime.now)
+    title: Optional[str] = None  # Video title reported by yt-dlp during the download
 
     def exists(self) -> bool:
         """Check if file exists on disk."""
@@ -131,7 +156,21 @@ class SubtitleFile:
             self.file_path.unlink()
 
 
-@dataclass
+@dataclass(slots=True)
+class SubtitleDownloadResult:
+    """Outcome of a subtitle download attempt for a single video."""
+
+    video_id: VideoId
+    subtitle_file: Optional[SubtitleFile] = None
+    error: Optional[DownloadError] = None
+
+    @property
+    def failed(self) -> bool:
+        """Check if the download failed."""
+        return self.error is not None
+
+
+@dataclass(slots=True)
 class DownloadProgress:
     """Value object representing download progress."""
 
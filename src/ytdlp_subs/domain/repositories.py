@@ -10,6 +10,8 @@ from ytdlp_subs.domain.models import SubtitleFile, VideoId, VideoMetadata
 class IVideoRepository(ABC):
     """Interface for video data access."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_video_metadata(self, video_id: VideoId) -> Optional[VideoMetadata]:
         """
@@ -38,7 +40,14 @@ class IVideoRepository(ABC):
 
 
 class ISubtitleRepository(ABC):
-    """Interface for subtitle data access."""
+    """
+    Interface for subtitle data access.
+
+    save_subtitles and flush are optional hooks with working defaults, not
+    abstract methods: most repositories have nothing to batch or buffer.
+    """
+
+    __slots__ = ()
 
     @abstractmethod
     def save_subtitle(self, subtitle: SubtitleFile) -> None:
@@ -50,6 +59,19 @@ class ISubtitleRepository(ABC):
         """
         pass
 
+    def save_subtitles(self, subtitles: list[SubtitleFile]) -> None:
+        """
+        Save several subtitle files at once.
+
+        Implementations must be safe to call from concurrent batch workers.
+        The default saves them one by one.
+
+        Args:
+            subtitles: Subtitle files to save
+        """
+        for subtitle in subtitles:
+            self.save_subtitle(subtitle)
+
     @abstractmethod
     def get_subtitle(
         self, video_id: VideoId, language: str, format: str
@@ -90,10 +112,15 @@ class ISubtitleRepository(ABC):
         """
         pass
 
+    def flush(self) -> None:  # noqa: B027
+        """Persist any buffered state. Does nothing by default."""
+
 
 class ICacheRepository(ABC):
     """Interface for cache data access."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_cached_video_ids(self) -> Optional[list[VideoId]]:
         """
@@ -131,7 +158,13 @@ class ICacheRepository(ABC):
 
 
 class IErrorRepository(ABC):
-    """Interface for error logging and tracking."""
+    """
+    Interface for error logging and tracking.
+
+    flush is optional; only repositories that buffer rows override it.
+    """
+
+    __slots__ = ()
 
     @abstractmethod
     def get_failed_video_ids(self) -> set[VideoId]:
@@ -154,3 +187,6 @@ class IErrorRepository(ABC):
             error_message: Detailed error message
         """
         pass
+
+    def flush(self) -> None:  # noqa: B027
+        """Persist any buffered errors. Does nothing by default."""
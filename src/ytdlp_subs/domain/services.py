@@ -2,9 +2,10 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from ytdlp_subs.domain.models import (
+    SubtitleDownloadResult,
     SubtitleFile,
     SubtitleFormat,
     SubtitleLanguage,
@@ -16,6 +17,8 @@ from ytdlp_subs.domain.models import (
 class IVideoFetcherService(ABC):
     """Interface for fetching video information."""
 
+    __slots__ = ()
+
     @abstractmethod
     def fetch_channel_videos(self, channel_url: str) -> list[VideoId]:
         """
@@ -46,6 +49,8 @@ class IVideoFetcherService(ABC):
 class ISubtitleDownloaderService(ABC):
     """Interface for downloading subtitles."""
 
+    __slots__ = ()
+
     @abstractmethod
     def download_subtitle(
         self,
@@ -66,10 +71,37 @@ class ISubtitleDownloaderService(ABC):
         """
         pass
 
+    @abstractmethod
+    def download_subtitles_batch(
+        self,
+        video_ids: list[VideoId],
+        languages: list[SubtitleLanguage],
+        output_dir: Path,
+        on_subtitle: Optional[Callable[[SubtitleFile], None]] = None,
+    ) -> dict[VideoId, SubtitleDownloadResult]:
+        """
+        Download subtitles for several videos in a single pass.
+
+        Each video gets the first of the languages that is available.
+
+        Args:
+            video_ids: Video identifiers
+            languages: Subtitle languages in order of preference
+            output_dir: Directory to save subtitles
+            on_subtitle: Optional callback invoked with each subtitle as soon
+                as it has been written, while the rest of the batch continues
+
+        Returns:
+            Mapping of every requested video ID to its download result
+        """
+        pass
+
 
 class IFileProcessorService(ABC):
     """Interface for processing subtitle files."""
 
+    __slots__ = ()
+
     @abstractmethod
     def process_file(
         self,
@@ -105,6 +137,8 @@ class IFileProcessorService(ABC):
 class IFilenameGeneratorService(ABC):
     """Interface for generating filenames."""
 
+    __slots__ = ()
+
     @abstractmethod
     def generate_filename(
         self,
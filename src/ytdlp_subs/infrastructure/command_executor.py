@@ -1,7 +1,8 @@
 """Command executor for running external commands."""
 
 import subprocess
-from typing import Optional
+import threading
+from typing import Callable, Optional
 
 from ytdlp_subs.domain.exceptions import CommandExecutionError
 from ytdlp_subs.infrastructure.logging import get_logger
@@ -12,6 +13,8 @@ logger = get_logger(__name__)
 class CommandResult:
     """Result of a command execution."""
 
+    __slots__ = ("stdout", "stderr", "return_code", "command")
+
     def __init__(
         self,
         stdout: str,
@@ -23,7 +26,8 @@ class CommandResult:
         Initialize command result.
 
         Args:
-            stdout: Standard output
+            stdout: Standard output; empty for execute_streaming(), which
+                hands every line to its callback instead of keeping it
             stderr: Standard error
             return_code: Process return code
             command: Command that was executed
@@ -64,6 +68,7 @@ class CommandExecutor:
         command: list[str],
         check: bool = True,
         capture_output: bool = True,
+        input_text: Optional[str] = None,
     ) -> CommandResult:
         """
         Execute a command.
@@ -72,6 +77,7 @@ class CommandExecutor:
             command: Command and arguments to execute
             check: Whether to raise exception on non-zero exit code
             capture_output: Whether to capture stdout/stderr
+            input_text: Optional text to feed to the command's stdin
 
         Returns:
             CommandResult object
@@ -79,11 +85,14 @@ class CommandExecutor:
         Raises:
             CommandExecutionError: If command fails and check=True
         """
-        logger.debug("Executing command", command=" ".join(command))
+        # Joined once for every log line of this run
+        command_line = " ".join(command)
+        logger.debug("Executing command", command=command_line)
 
         try:
             result = subprocess.run(
                 command,
+                input=input_text,
                 capture_output=capture_output,
                 text=True,
                 encoding="utf-8",
@@ -101,7 +110,7 @@ class CommandExecutor:
             if check and not cmd_result.success:
                 logger.error(
                     "Command failed",
-                    command=" ".join(command),
+                    command=command_line,
                     return_code=result.returncode,
                     stderr=result.stderr,
                 )
@@ -114,7 +123,7 @@ class CommandExecutor:
 
             logger.debug(
                 "Command completed",
-                command=" ".join(command),
+                command=command_line,
                 return_code=result.returncode,
             )
 
@@ -124,7 +133,7 @@ class CommandExecutor:
             raise
 
         except subprocess.TimeoutExpired as e:
-            logger.error("Command timed out", command=" ".join(command), timeout=self.timeout)
+            logger.error("Command timed out", command=command_line, timeout=self.timeout)
             raise CommandExecutionError(
                 f"Command timed out after {self.timeout} seconds",
                 command=command,
@@ -139,8 +148,135 @@ class CommandExecutor:
             ) from e
 
         except Exception as e:
-            logger.error("Unexpected error executing command", command=" ".join(command), error=str(e))
+            logger.error("Unexpected error executing command", command=command_line, error=str(e))
             raise CommandExecutionError(
                 f"Unexpected error executing command: {e}",
                 command=command,
             ) from e
+
+    def execute_streaming(
+        self,
+        command: list[str],
+        on_line: Callable[[str], None],
+        check: bool = True,
+        input_text: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> CommandResult:
+        """
+        Execute a command, handing each stdout line to a callback as it arrives.
+
+        Stdout is never buffered in full, so memory stays constant no matter
+        how much the command prints. For the same reason the returned result
+        carries only the return code and stderr: its stdout is always empty.
+
+        Args:
+            command: Command and arguments to execute
+            on_line: Called with every stdout line, without the trailing newline
+            check: Whether to raise exception on non-zero exit code
+            input_text: Optional text to feed to the command's stdin
+            timeout: Timeout in seconds for this call, instead of the executor's
+
+        Returns:
+            CommandResult object with empty stdout
+
+        Raises:
+            CommandExecutionError: If command fails and check=True
+        """
+        command_line = " ".join(command)
+        logger.debug("Executing command", command=command_line, streaming=True)
+        if timeout is None:
+            timeout = self.timeout
+
+        try:
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE if input_text is not None else subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+            )
+        except FileNotFoundError as e:
+            logger.error("Command not found", command=command[0])
+            raise CommandExecutionError(
+                f"Command not found: {command[0]}",
+                command=command,
+            ) from e
+
+        # Both pipes were requested above, so Popen always opens them
+        stdout_pipe, stderr_pipe = process.stdout, process.stderr
+        assert stdout_pipe is not None and stderr_pipe is not None
+
+        # Feed stdin and drain stderr in the background so neither pipe can
+        # fill up and block the process while we read stdout
+        stderr_chunks: list[str] = []
+        workers = [threading.Thread(target=lambda: stderr_chunks.append(stderr_pipe.read()))]
+        if input_text is not None:
+            workers.append(threading.Thread(target=self._write_stdin, args=(process, input_text)))
+
+        timed_out = threading.Event()
+
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            process.kill()
+
+        timer = None
+        if timeout is not None:
+            timer = threading.Timer(timeout, kill_on_timeout)
+            timer.start()
+
+        for worker in workers:
+            worker.start()
+
+        try:
+            for line in stdout_pipe:
+                on_line(line.rstrip("\n"))
+        except BaseException:
+            process.kill()
+            raise
+        finally:
+            stdout_pipe.close()
+            return_code = process.wait()
+            for worker in workers:
+                worker.join()
+            if timer is not None:
+                timer.cancel()
+
+        stderr = "".join(stderr_chunks)
+
+        if timed_out.is_set():
+            logger.error("Command timed out", command=command_line, timeout=timeout)
+            raise CommandExecutionError(
+                f"Command timed out after {timeout} seconds",
+                command=command,
+                timeout=timeout,
+            )
+
+        if check and return_code != 0:
+            logger.error(
+                "Command failed",
+                command=command_line,
+                return_code=return_code,
+                stderr=stderr,
+            )
+            raise CommandExecutionError(
+                f"Command failed with return code {return_code}",
+                command=command,
+                return_code=return_code,
+                stderr=stderr,
+            )
+
+        logger.debug("Command completed", command=command_line, return_code=return_code)
+
+        return CommandResult(stdout="", stderr=stderr, return_code=return_code, command=command)
+
+    @staticmethod
+    def _write_stdin(process: subprocess.Popen[str], input_text: str) -> None:
+        """Write input to the process stdin and close it, ignoring early exits."""
+        if process.stdin is None:
+            return
+        try:
+            process.stdin.write(input_text)
+            process.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
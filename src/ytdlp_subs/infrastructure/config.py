@@ -46,6 +46,22 @@ class AppConfig(BaseSettings):
         description="Maximum wait time between downloads",
     )
 
+    # Batching
+    batch_size: int = Field(
+        default=50,
+        ge=1,
+        description="Number of videos handed to a single yt-dlp invocation",
+    )
+    concurrency: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum number of batches downloaded simultaneously",
+    )
+    in_process: bool = Field(
+        default=False,
+        description="Run yt-dlp in-process through its Python API instead of as a subprocess",
+    )
+
     # Browser cookies
     cookies_from_browser: Optional[str] = Field(
         default=None,
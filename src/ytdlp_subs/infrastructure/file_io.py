@@ -0,0 +1,59 @@
+"""Shared file I/O settings and helpers."""
+
+import os
+import stat
+import tempfile
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import IO, Iterator, Optional
+
+# Buffer size for file reads and writes. Larger than the 4-8 KiB default so
+# cache, error log and subtitle files are written with far fewer syscalls,
+# which matters most on network filesystems (SMB/NFS).
+BUFFER_SIZE = 64 * 1024
+
+
+def _current_umask() -> int:
+    """Read the process umask; os.umask can only be read by setting it."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Read once at import, before worker threads exist: setting the umask, even
+# briefly, would affect files other threads create meanwhile
+_UMASK = _current_umask()
+
+
+@contextmanager
+def atomic_write(path: Path, newline: Optional[str] = None) -> Iterator[IO[str]]:
+    """
+    Open a text file for writing that replaces ``path`` only once fully written.
+
+    Content goes to a temporary file in the same directory which is moved
+    over ``path`` with os.replace on success and removed on failure, so an
+    interrupted write never leaves a truncated file behind. The file keeps
+    the mode of the file it replaces, or gets the umask default when new,
+    instead of the 0600 mkstemp creates it with.
+
+    Args:
+        path: Destination file path
+        newline: Newline translation mode passed to open()
+
+    Yields:
+        Writable text file handle
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with open(fd, "w", encoding="utf-8", newline=newline, buffering=BUFFER_SIZE) as f:
+            yield f
+        try:
+            mode = stat.S_IMODE(path.stat().st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_name)
+        raise
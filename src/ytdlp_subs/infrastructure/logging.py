@@ -2,12 +2,16 @@
 
 import logging
 import sys
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
 import structlog
 from structlog.types import EventDict, Processor
 
+# Set once logging is configured; later calls would only stack more handlers
+_configured = False
+
 
 def add_log_level(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
     """Add log level to event dict."""
@@ -17,8 +21,6 @@ def add_log_level(logger: Any, method_name: str, event_dict: EventDict) -> Event
 
 def add_timestamp(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
     """Add timestamp to event dict."""
-    from datetime import datetime
-
     event_dict["timestamp"] = datetime.now().isoformat()
     return event_dict
 
@@ -31,27 +33,37 @@ def configure_logging(
     """
     Configure structured logging.
 
+    Only the first call in a process takes effect.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional file path for logging
         json_logs: Whether to output JSON formatted logs
     """
+    global _configured
+    if _configured:
+        return
+
+    level = getattr(logging, log_level.upper())
+
     # Configure standard library logging
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
+        level=level,
     )
 
     # Add file handler if specified
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(getattr(logging, log_level.upper()))
+        file_handler.setLevel(level)
         logging.root.addHandler(file_handler)
 
-    # Configure structlog processors
+    # Configure structlog processors. Filtering by level comes first so
+    # disabled calls (mostly debug) skip timestamping and rendering.
     processors: list[Processor] = [
+        structlog.stdlib.filter_by_level,
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_logger_name,
         add_log_level,
@@ -79,6 +91,7 @@ def configure_logging(
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
+    _configured = True
 
 
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
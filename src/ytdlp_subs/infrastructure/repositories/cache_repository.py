@@ -6,6 +6,7 @@ from typing import Optional
 from ytdlp_subs.domain.exceptions import CacheError
 from ytdlp_subs.domain.models import VideoId
 from ytdlp_subs.domain.repositories import ICacheRepository
+from ytdlp_subs.infrastructure.file_io import atomic_write
 from ytdlp_subs.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
@@ -30,21 +31,22 @@ class FileCacheRepository(ICacheRepository):
         Returns:
             List of video IDs if cache exists and is valid, None otherwise
         """
-        if not self.cache_file or not self.cache_file.exists():
+        if not self.cache_file:
             logger.debug("Cache file does not exist", cache_file=str(self.cache_file))
             return None
 
         try:
             logger.info("Loading video IDs from cache", cache_file=str(self.cache_file))
 
-            with open(self.cache_file, "r", encoding="utf-8") as f:
-                lines = [line.strip() for line in f if line.strip()]
+            # One bulk read; str.split() drops blank lines and surrounding
+            # whitespace in C instead of stripping every line in Python
+            lines = self.cache_file.read_text(encoding="utf-8").split()
 
             if not lines:
                 logger.warning("Cache file is empty", cache_file=str(self.cache_file))
                 return None
 
-            video_ids = [VideoId(line) for line in lines]
+            video_ids = list(map(VideoId, lines))
             logger.info(
                 "Loaded video IDs from cache",
                 count=len(video_ids),
@@ -53,6 +55,10 @@ class FileCacheRepository(ICacheRepository):
 
             return video_ids
 
+        except FileNotFoundError:
+            logger.debug("Cache file does not exist", cache_file=str(self.cache_file))
+            return None
+
         except (IOError, OSError) as e:
             logger.error(
                 "Failed to read cache file",
@@ -99,9 +105,12 @@ class FileCacheRepository(ICacheRepository):
                 cache_file=str(self.cache_file),
             )
 
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                for video_id in video_ids:
-                    f.write(f"{video_id}\n")
+            # Replace the cache only once fully written so an interrupted run
+            # never leaves a truncated cache behind
+            with atomic_write(self.cache_file) as f:
+                f.write("\n".join(map(str, video_ids)))
+                if video_ids:
+                    f.write("\n")
 
             logger.info(
                 "Successfully saved video IDs to cache",
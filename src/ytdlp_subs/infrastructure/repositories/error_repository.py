@@ -1,29 +1,45 @@
 """File-based implementation of error repository."""
 
+import atexit
 import csv
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, TextIO
 
 from ytdlp_subs.domain.models import VideoId
 from ytdlp_subs.domain.repositories import IErrorRepository
+from ytdlp_subs.infrastructure.file_io import BUFFER_SIZE
 from ytdlp_subs.infrastructure.logging import get_logger
 
+if TYPE_CHECKING:
+    from _csv import Writer
+
 logger = get_logger(__name__)
 
 
 class FileErrorRepository(IErrorRepository):
     """File-based implementation of error repository."""
 
-    def __init__(self, error_log_path: Optional[Path]) -> None:
+    def __init__(self, error_log_path: Optional[Path], flush_interval: int = 50) -> None:
         """
         Initialize the repository.
 
         Args:
             error_log_path: Path to the error log file (CSV)
+            flush_interval: Number of recorded errors after which the buffer is flushed
         """
         self.error_log_path = error_log_path
+        self.flush_interval = flush_interval
+        self._unflushed = 0
+        self._failed_ids: Optional[set[VideoId]] = None
+        self._log_file: Optional[TextIO] = None
+        self._writer: Optional[Writer] = None
+        self._lock = threading.Lock()
         self._ensure_file_exists()
 
+        # Buffered rows must reach the file even if the caller never flushes
+        atexit.register(self.close)
+
     def _ensure_file_exists(self) -> None:
         """Ensure the error log file and parent directories exist."""
         if not self.error_log_path:
@@ -48,30 +64,16 @@ class FileErrorRepository(IErrorRepository):
         Returns:
             Set of failed video IDs
         """
-        failed_ids = set()
-
-        if not self.error_log_path or not self.error_log_path.exists():
-            return failed_ids
-
-        try:
-            with open(self.error_log_path, "r", newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    video_id_str = row.get("Video ID")
-                    if video_id_str:
-                        failed_ids.add(VideoId(video_id_str))
-        except Exception as e:
-            logger.error("Failed to read error log file", error_path=str(self.error_log_path), error=str(e))
-
-        if failed_ids:
-            logger.info("Loaded failed video IDs from error log", count=len(failed_ids))
-
-        return failed_ids
+        with self._lock:
+            return set(self._load_failed_ids())
 
     def record_error(self, video_id: VideoId, error_type: str, error_message: str) -> None:
         """
         Record a video processing error.
 
+        Rows are appended through a buffered handle kept open for the whole
+        run and pushed to disk every ``flush_interval`` errors or on flush().
+
         Args:
             video_id: Video identifier
             error_type: Type/Class of the error
@@ -80,16 +82,82 @@ class FileErrorRepository(IErrorRepository):
         if not self.error_log_path:
             return
 
+        with self._lock:
+            try:
+                # Check if this ID is already logged to avoid duplicates
+                failed_ids = self._load_failed_ids()
+                if video_id in failed_ids:
+                    return
+
+                if self._writer is None:
+                    # Kept open across calls on purpose; close() releases it
+                    self._log_file = open(  # noqa: SIM115
+                        self.error_log_path, "a", newline="", encoding="utf-8", buffering=BUFFER_SIZE
+                    )
+                    self._writer = csv.writer(self._log_file)
+
+                self._writer.writerow([str(video_id), video_id.url, error_type, error_message])
+                failed_ids.add(video_id)
+
+                self._unflushed += 1
+                if self._unflushed >= self.flush_interval:
+                    self._flush_locked()
+
+                logger.debug("Recorded error for video", video_id=str(video_id), error_type=error_type)
+            except Exception as e:
+                logger.error("Failed to write to error log file", error_path=str(self.error_log_path), error=str(e))
+
+    def flush(self) -> None:
+        """Write buffered error rows to disk."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Flush and close the error log handle."""
+        self.flush()
+        with self._lock:
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
+                self._writer = None
+
+    def _flush_locked(self) -> None:
+        """Flush the append handle (caller holds the lock)."""
+        if self._log_file is None:
+            return
         try:
-            # Check if this ID is already in the file to avoid duplicates
-            existing_ids = self.get_failed_video_ids()
-            if video_id in existing_ids:
-                return
+            self._log_file.flush()
+            self._unflushed = 0
+        except OSError as e:
+            logger.error("Failed to flush error log file", error_path=str(self.error_log_path), error=str(e))
+
+    def _load_failed_ids(self) -> set[VideoId]:
+        """Read failed video IDs from the log once and keep them in memory (caller holds the lock)."""
+        if self._failed_ids is not None:
+            return self._failed_ids
 
-            with open(self.error_log_path, "a", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow([str(video_id), video_id.url, error_type, error_message])
+        failed_ids: set[VideoId] = set()
+
+        if not self.error_log_path or not self.error_log_path.exists():
+            self._failed_ids = failed_ids
+            return failed_ids
 
-            logger.debug("Recorded error for video", video_id=str(video_id), error_type=error_type)
+        try:
+            with open(self.error_log_path, "r", newline="", encoding="utf-8", buffering=BUFFER_SIZE) as f:
+                # Plain rows instead of DictReader: only the ID column is
+                # needed, so skip building a dict for every logged error
+                reader = csv.reader(f)
+                header = next(reader, [])
+                if "Video ID" in header:
+                    column = header.index("Video ID")
+                    failed_ids.update(
+                        VideoId(row[column]) for row in reader if len(row) > column and row[column]
+                    )
         except Exception as e:
-            logger.error("Failed to write to error log file", error_path=str(self.error_log_path), error=str(e))
+            logger.error("Failed to read error log file", error_path=str(self.error_log_path), error=str(e))
+
+        if failed_ids:
+            logger.info("Loaded failed video IDs from error log", count=len(failed_ids))
+
+        self._failed_ids = failed_ids
+        return failed_ids
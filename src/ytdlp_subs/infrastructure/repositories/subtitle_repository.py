@@ -1,11 +1,16 @@
 """File system-based subtitle repository implementation."""
 
+import atexit
+import json
+import os
 import re
+import threading
 from pathlib import Path
 from typing import Optional
 
 from ytdlp_subs.domain.models import SubtitleFile, SubtitleFormat, SubtitleLanguage, VideoId
 from ytdlp_subs.domain.repositories import ISubtitleRepository
+from ytdlp_subs.infrastructure.file_io import BUFFER_SIZE
 from ytdlp_subs.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
@@ -17,6 +22,9 @@ class FileSystemSubtitleRepository(ISubtitleRepository):
     # Pattern to extract video ID from filename: optional_number_videoID_title.lang.ext
     VIDEO_ID_PATTERN = re.compile(r"^(?:\d+_)?([a-zA-Z0-9_-]{11})_.*")
 
+    # Sidecar index of downloaded video IDs, valid while the directory mtime matches
+    INDEX_FILENAME = ".downloaded_ids.json"
+
     def __init__(self, output_dir: Path) -> None:
         """
         Initialize file system subtitle repository.
@@ -26,11 +34,21 @@ class FileSystemSubtitleRepository(ISubtitleRepository):
         """
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = output_dir / self.INDEX_FILENAME
+        self._downloaded_ids: Optional[set[VideoId]] = None
+        self._unflushed = 0
+        self._lock = threading.Lock()
+
+        # Saves not yet flushed must not be lost on interpreter exit
+        atexit.register(self.flush)
 
     def save_subtitle(self, subtitle: SubtitleFile) -> None:
         """
         Save subtitle metadata (file should already exist on disk).
 
+        The index is not rewritten here; flush() does that once the caller
+        has finished putting a batch of files in place.
+
         Args:
             subtitle: Subtitle file to save
 
@@ -45,6 +63,38 @@ class FileSystemSubtitleRepository(ISubtitleRepository):
             path=str(subtitle.file_path),
         )
 
+        with self._lock:
+            if self._downloaded_ids is None:
+                return
+
+            self._downloaded_ids.add(subtitle.video_id)
+            self._unflushed += 1
+
+    def save_subtitles(self, subtitles: list[SubtitleFile]) -> None:
+        """
+        Save several subtitles under a single lock acquisition.
+
+        Args:
+            subtitles: Subtitle files to save
+        """
+        if not subtitles:
+            return
+
+        logger.debug("Subtitles saved", count=len(subtitles))
+
+        with self._lock:
+            if self._downloaded_ids is None:
+                return
+
+            self._downloaded_ids.update(subtitle.video_id for subtitle in subtitles)
+            self._unflushed += len(subtitles)
+
+    def flush(self) -> None:
+        """Write the downloaded IDs index if subtitles were saved since the last write."""
+        with self._lock:
+            if self._downloaded_ids is not None and self._unflushed:
+                self._write_index(self._downloaded_ids)
+
     def get_subtitle(
         self,
         video_id: VideoId,
@@ -94,21 +144,26 @@ class FileSystemSubtitleRepository(ISubtitleRepository):
         """
         Check if any subtitle exists for a video.
 
+        Answered from the downloaded IDs set, which is loaded on first use
+        and kept current by save_subtitle, instead of globbing the directory
+        on every call.
+
         Args:
             video_id: Video identifier
 
         Returns:
             True if subtitle exists
         """
-        pattern = f"*{video_id}*"
-        matches = list(self.output_dir.glob(pattern))
-        exists = len(matches) > 0
+        if self._downloaded_ids is None:
+            self.get_downloaded_video_ids()
+
+        with self._lock:
+            exists = self._downloaded_ids is not None and video_id in self._downloaded_ids
 
         logger.debug(
             "Subtitle existence check",
             video_id=str(video_id),
             exists=exists,
-            count=len(matches),
         )
 
         return exists
@@ -117,37 +172,108 @@ class FileSystemSubtitleRepository(ISubtitleRepository):
         """
         Get all video IDs that have downloaded subtitles.
 
+        The set is loaded once per repository and then kept current by
+        save_subtitle. On first load the sidecar index is used when the
+        directory has not changed since it was written; otherwise the
+        directory is scanned and the index rebuilt.
+
         Returns:
             Set of video IDs
         """
+        with self._lock:
+            if self._downloaded_ids is not None:
+                return set(self._downloaded_ids)
+
         if not self.output_dir.exists():
             logger.debug("Output directory does not exist", output_dir=str(self.output_dir))
             return set()
 
+        downloaded_ids = self._load_index()
+
+        with self._lock:
+            if downloaded_ids is None:
+                downloaded_ids = self._scan_output_dir()
+                self._downloaded_ids = set(downloaded_ids)
+                self._write_index(self._downloaded_ids)
+            else:
+                self._downloaded_ids = set(downloaded_ids)
+
+        logger.info(
+            "Found downloaded videos",
+            count=len(downloaded_ids),
+            output_dir=str(self.output_dir),
+        )
+
+        return downloaded_ids
+
+    def _scan_output_dir(self) -> set[VideoId]:
+        """Collect video IDs from the subtitle filenames in the output directory."""
         logger.debug("Scanning output directory for downloaded videos")
 
         downloaded_ids: set[VideoId] = set()
 
-        for file_path in self.output_dir.iterdir():
-            if not file_path.is_file():
-                continue
+        # os.scandir yields DirEntry objects whose is_file() is answered from
+        # the directory listing itself, without a stat() per file
+        with os.scandir(self.output_dir) as entries:
+            for entry in entries:
+                match = self.VIDEO_ID_PATTERN.match(entry.name)
+                if not match or not entry.is_file():
+                    continue
 
-            match = self.VIDEO_ID_PATTERN.match(file_path.name)
-            if match:
                 try:
                     video_id = VideoId(match.group(1))
                     downloaded_ids.add(video_id)
                 except ValueError:
                     logger.warning(
                         "Invalid video ID in filename",
-                        filename=file_path.name,
+                        filename=entry.name,
                     )
                     continue
 
-        logger.info(
-            "Found downloaded videos",
-            count=len(downloaded_ids),
-            output_dir=str(self.output_dir),
-        )
-
         return downloaded_ids
+
+    def _load_index(self) -> Optional[set[VideoId]]:
+        """Load the downloaded IDs index, or None if it is missing or stale."""
+        try:
+            with open(self.index_file, encoding="utf-8", buffering=BUFFER_SIZE) as f:
+                data = json.load(f)
+
+            if data["dir_mtime_ns"] != self.output_dir.stat().st_mtime_ns:
+                logger.debug("Downloaded IDs index is stale", index_file=str(self.index_file))
+                return None
+
+            return {VideoId(video_id) for video_id in data["video_ids"]}
+
+        except FileNotFoundError:
+            return None
+
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(
+                "Ignoring unreadable downloaded IDs index",
+                index_file=str(self.index_file),
+                error=str(e),
+            )
+            return None
+
+    def _write_index(self, downloaded_ids: set[VideoId]) -> None:
+        """Write the downloaded IDs index (caller holds the lock)."""
+        try:
+            # Create the file first and rewrite it in place, so the write
+            # itself does not change the directory mtime recorded below
+            self.index_file.touch()
+            data = {
+                "dir_mtime_ns": self.output_dir.stat().st_mtime_ns,
+                "video_ids": sorted(str(video_id) for video_id in downloaded_ids),
+            }
+
+            with open(self.index_file, "w", encoding="utf-8", buffering=BUFFER_SIZE) as f:
+                json.dump(data, f)
+
+            self._unflushed = 0
+
+        except OSError as e:
+            logger.warning(
+                "Failed to write downloaded IDs index",
+                index_file=str(self.index_file),
+                error=str(e),
+            )
@@ -1,6 +1,7 @@
 """YT-DLP based video repository implementation."""
 
 import json
+from collections import deque
 from datetime import datetime
 from typing import Optional
 from urllib.parse import parse_qs, urlparse
@@ -10,6 +11,7 @@ from ytdlp_subs.domain.models import SubtitleLanguage, VideoId, VideoMetadata
 from ytdlp_subs.domain.repositories import IVideoRepository
 from ytdlp_subs.infrastructure.command_executor import CommandExecutor
 from ytdlp_subs.infrastructure.logging import get_logger
+from ytdlp_subs.infrastructure.ytdlp import build_base_command, with_android_fallback
 
 logger = get_logger(__name__)
 
@@ -17,12 +19,31 @@ logger = get_logger(__name__)
 class YtDlpVideoRepository(IVideoRepository):
     """YT-DLP based implementation of video repository."""
 
+    __slots__ = (
+        "command_executor",
+        "cookies_from_browser",
+        "js_runtimes",
+        "remote_components",
+        "allowed_langs",
+        "_base_cmd",
+    )
+
+    # Print only the fields _parse_metadata reads instead of the full info
+    # dict, whose formats and thumbnails dwarf everything else
+    METADATA_PRINT_TEMPLATE = (
+        "%(.{id,title,duration,upload_date,channel,description,view_count,automatic_captions})j"
+    )
+
+    # Metadata never needs formats, so skip fetching the DASH and HLS manifests
+    METADATA_EXTRACTOR_ARGS = ["--extractor-args", "youtube:skip=dash,hls"]
+
     def __init__(
         self,
         command_executor: CommandExecutor,
         cookies_from_browser: Optional[str] = None,
         js_runtimes: str = "node",
         remote_components: str = "ejs:github",
+        allowed_langs: Optional[frozenset[str]] = None,
     ) -> None:
         """
         Initialize YT-DLP video repository.
@@ -32,11 +53,15 @@ class YtDlpVideoRepository(IVideoRepository):
             cookies_from_browser: Optional browser to extract cookies from
             js_runtimes: JS runtimes to use for yt-dlp challenges
             remote_components: Remote components to fetch
+            allowed_langs: Language codes kept in available_subtitles; all
+                supported languages are kept when None
         """
         self.command_executor = command_executor
         self.cookies_from_browser = cookies_from_browser
         self.js_runtimes = js_runtimes
         self.remote_components = remote_components
+        self.allowed_langs = allowed_langs
+        self._base_cmd: list[str] = build_base_command(js_runtimes, remote_components, cookies_from_browser)
 
     def get_video_metadata(self, video_id: VideoId) -> Optional[VideoMetadata]:
         """
@@ -55,21 +80,24 @@ class YtDlpVideoRepository(IVideoRepository):
 
         command = self._build_metadata_command(video_id.url)
 
+        # Only the final JSON line matters; keep it instead of the whole stdout
+        last_line: deque[str] = deque(maxlen=1)
+
         try:
-            result = self.command_executor.execute(command, check=True)
+            self.command_executor.execute_streaming(command, on_line=last_line.append)
         except CommandExecutionError as e:
             logger.warning("Main yt-dlp command failed. Retrying with Android client fallback...", video_id=str(video_id))
-            fallback_cmd = command[:-1] + ["--extractor-args", "youtube:player_client=android", command[-1]]
+            fallback_cmd = with_android_fallback(command)
+            last_line.clear()
             try:
-                result = self.command_executor.execute(fallback_cmd, check=True)
+                self.command_executor.execute_streaming(fallback_cmd, on_line=last_line.append)
             except CommandExecutionError as fallback_e:
                 self._handle_command_error(fallback_e, video_id=str(video_id))
                 raise
 
         try:
             # Parse JSON output (last line of stdout)
-            json_output = result.stdout.strip().split("\n")[-1]
-            data = json.loads(json_output)
+            data = json.loads(last_line[0] if last_line else "")
 
             metadata = self._parse_metadata(data, video_id)
 
@@ -121,36 +149,27 @@ class YtDlpVideoRepository(IVideoRepository):
 
         command = self._build_channel_command(channel_url)
 
-        try:
-            result = self.command_executor.execute(command, check=True)
-        except CommandExecutionError as e:
-            logger.warning("Main yt-dlp command failed. Retrying with Android client fallback...", channel_url=channel_url)
-            fallback_cmd = command[:-1] + ["--extractor-args", "youtube:player_client=android", command[-1]]
-            try:
-                result = self.command_executor.execute(fallback_cmd, check=True)
-            except CommandExecutionError as fallback_e:
-                self._handle_command_error(fallback_e, channel_url=channel_url)
-                raise
-
-        try:
-            # Each line is a video ID
-            video_id_strings = [
-                line.strip() for line in result.stdout.strip().split("\n") if line.strip()
-            ]
-
-            if not video_id_strings:
-                logger.warning("No videos found in channel", channel_url=channel_url)
-                return []
+        # Parse IDs as yt-dlp prints them instead of buffering the whole
+        # listing and splitting it afterwards
+        video_ids: list[VideoId] = []
 
-            video_ids = [VideoId(vid) for vid in video_id_strings]
+        def collect(line: str) -> None:
+            line = line.strip()
+            if line:
+                video_ids.append(VideoId(line))
 
-            logger.info(
-                "Successfully fetched channel video IDs",
-                channel_url=channel_url,
-                count=len(video_ids),
-            )
-
-            return video_ids
+        try:
+            try:
+                self.command_executor.execute_streaming(command, on_line=collect)
+            except CommandExecutionError as e:
+                logger.warning("Main yt-dlp command failed. Retrying with Android client fallback...", channel_url=channel_url)
+                fallback_cmd = with_android_fallback(command)
+                video_ids.clear()
+                try:
+                    self.command_executor.execute_streaming(fallback_cmd, on_line=collect)
+                except CommandExecutionError as fallback_e:
+                    self._handle_command_error(fallback_e, channel_url=channel_url)
+                    raise
 
         except ValueError as e:
             logger.error(
@@ -163,6 +182,9 @@ class YtDlpVideoRepository(IVideoRepository):
                 channel_url=channel_url,
             ) from e
 
+        except (CommandExecutionError, VideoFetchError):
+            raise
+
         except Exception as e:
             logger.error(
                 "Failed to fetch channel videos",
@@ -174,6 +196,18 @@ class YtDlpVideoRepository(IVideoRepository):
                 channel_url=channel_url,
             ) from e
 
+        if not video_ids:
+            logger.warning("No videos found in channel", channel_url=channel_url)
+            return []
+
+        logger.info(
+            "Successfully fetched channel video IDs",
+            channel_url=channel_url,
+            count=len(video_ids),
+        )
+
+        return video_ids
+
     def is_video_url(self, url: str) -> bool:
         """Check if URL points to a single video instead of a channel/playlist."""
         parsed = urlparse(url)
@@ -190,17 +224,8 @@ class YtDlpVideoRepository(IVideoRepository):
         )
 
     def _build_base_cmd(self) -> list[str]:
-        """Build the base yt-dlp command with common anti-bot options."""
-        cmd = [
-            "yt-dlp",
-            "--js-runtimes", self.js_runtimes,
-            "--remote-components", self.remote_components,
-        ]
-        
-        if self.cookies_from_browser:
-            cmd.extend(["--cookies-from-browser", self.cookies_from_browser])
-            
-        return cmd
+        """Return a fresh copy of the base yt-dlp command with common anti-bot options."""
+        return self._base_cmd.copy()
 
     def _handle_command_error(self, e: CommandExecutionError, **context) -> None:
         """Handle CommandExecutionError and raise appropriate VideoFetchError."""
@@ -246,8 +271,10 @@ class YtDlpVideoRepository(IVideoRepository):
         """Build yt-dlp command for fetching metadata."""
         command = self._build_base_cmd()
         command.extend([
-            "--dump-json",
+            "--print",
+            self.METADATA_PRINT_TEMPLATE,
             "--skip-download",
+            *self.METADATA_EXTRACTOR_ARGS,
             video_url
         ])
         return command
@@ -259,32 +286,38 @@ class YtDlpVideoRepository(IVideoRepository):
         if self.is_video_url(channel_url):
             command.extend(["--no-playlist", "--print", "id", channel_url])
         else:
-            command.extend(["--flat-playlist", "--print", "id", channel_url])
+            # --lazy-playlist prints IDs page by page as they are fetched instead
+            # of after the whole channel has been walked
+            command.extend(["--lazy-playlist", "--flat-playlist", "--print", "id", channel_url])
             
         return command
 
     def _parse_metadata(self, data: dict, video_id: VideoId) -> VideoMetadata:
         """Parse yt-dlp JSON output into VideoMetadata."""
-        # Parse available subtitles
+        # Parse available subtitles in one pass. YouTube lists 100+ auto-translated
+        # caption languages; codes outside the configured preferences are
+        # skipped before lookup, and unsupported ones are dropped without
+        # raising and logging for each of them.
+        allowed_langs = self.allowed_langs
         available_subs: list[SubtitleLanguage] = []
-        automatic_captions = data.get("automatic_captions", {})
-
-        for lang_code in automatic_captions.keys():
-            try:
-                lang = SubtitleLanguage.from_string(lang_code)
-                available_subs.append(lang)
-            except ValueError:
-                # Skip unsupported languages
-                logger.debug("Skipping unsupported language", language=lang_code)
+        for lang_code in data.get("automatic_captions") or {}:
+            code = lang_code.lower()
+            if allowed_langs is not None and code not in allowed_langs:
                 continue
+            lang = SubtitleLanguage.lookup(code)
+            if lang is not None:
+                available_subs.append(lang)
 
-        # Parse upload date
+        # Parse upload date (YYYYMMDD) by slicing; strptime is far slower for a fixed format
         upload_date = None
-        if "upload_date" in data:
+        raw_date = data.get("upload_date")
+        if raw_date:
             try:
-                upload_date = datetime.strptime(data["upload_date"], "%Y%m%d")
-            except ValueError:
-                logger.warning("Failed to parse upload date", date=data["upload_date"])
+                if len(raw_date) != 8:
+                    raise ValueError(raw_date)
+                upload_date = datetime(int(raw_date[:4]), int(raw_date[4:6]), int(raw_date[6:]))
+            except (TypeError, ValueError):
+                logger.warning("Failed to parse upload date", date=raw_date)
 
         return VideoMetadata(
             video_id=video_id,
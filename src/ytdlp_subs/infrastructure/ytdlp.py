@@ -0,0 +1,78 @@
+"""Shared yt-dlp command building."""
+
+import shutil
+from functools import lru_cache
+from typing import Optional
+
+# Extractor arguments that switch YouTube extraction to the Android player client
+ANDROID_CLIENT_ARGS = ["--extractor-args", "youtube:player_client=android"]
+
+# Options for runs that only fetch subtitles: no media download, no progress
+# output to drain, and no failure when a video has no playable formats
+SUBTITLE_ONLY_ARGS = ["--skip-download", "--no-progress", "--no-playlist", "--ignore-no-formats-error"]
+
+
+@lru_cache(maxsize=1)
+def ytdlp_executable() -> str:
+    """
+    Resolve the yt-dlp executable once instead of searching PATH on every spawn.
+
+    Returns:
+        Absolute path to yt-dlp, or the bare name if it is not on PATH
+    """
+    return shutil.which("yt-dlp") or "yt-dlp"
+
+
+def build_base_command(
+    js_runtimes: str,
+    remote_components: str,
+    cookies_from_browser: Optional[str] = None,
+) -> list[str]:
+    """
+    Build the base yt-dlp command with common anti-bot options.
+
+    The prefix never changes for a given configuration, so callers build it
+    once and copy it for each command.
+
+    Args:
+        js_runtimes: JS runtimes to use for yt-dlp challenges
+        remote_components: Remote components to fetch
+        cookies_from_browser: Optional browser to extract cookies from
+
+    Returns:
+        Command prefix shared by every yt-dlp invocation
+    """
+    command = [
+        ytdlp_executable(),
+        "--js-runtimes", js_runtimes,
+        "--remote-components", remote_components,
+    ]
+
+    if cookies_from_browser:
+        command.extend(["--cookies-from-browser", cookies_from_browser])
+
+    return command
+
+
+def with_android_fallback(command: list[str]) -> list[str]:
+    """
+    Insert the Android client arguments before the trailing URL of a command.
+
+    yt-dlp keeps only the last ``--extractor-args`` given for an extractor, so
+    YouTube arguments already on the command are merged into a single value
+    instead of being overridden by a second flag.
+
+    Args:
+        command: yt-dlp command ending with the target URL
+
+    Returns:
+        New command that retries extraction with the Android client
+    """
+    flag, client_arg = ANDROID_CLIENT_ARGS
+    for index, arg in enumerate(command[:-2]):
+        value = command[index + 1]
+        if arg == flag and value.startswith("youtube:"):
+            merged = f"{client_arg};{value.removeprefix('youtube:')}"
+            return command[: index + 1] + [merged] + command[index + 2 :]
+
+    return command[:-1] + ANDROID_CLIENT_ARGS + command[-1:]
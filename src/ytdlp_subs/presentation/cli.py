@@ -1,29 +1,23 @@
 """CLI presentation layer using Rich for beautiful output."""
 
 import sys
-from typing import NoReturn
+from typing import TYPE_CHECKING, NoReturn
 
 import argparse
 from pathlib import Path
 
 from rich.console import Console
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TaskProgressColumn,
-    TextColumn,
-    TimeElapsedColumn,
-)
-from rich.table import Table
 
 from ytdlp_subs import __version__
-from ytdlp_subs.application.container import Container
 from ytdlp_subs.domain.exceptions import SubtitleDownloaderError
 from ytdlp_subs.domain.models import DownloadProgress
-from ytdlp_subs.infrastructure.config import AppConfig
 from ytdlp_subs.infrastructure.logging import configure_logging, get_logger
 
+# The container, settings (pydantic) and Rich widgets are imported where they
+# are used, so --help, --version and argument errors return without loading them
+if TYPE_CHECKING:
+    from ytdlp_subs.infrastructure.config import AppConfig
+
 console = Console()
 logger = get_logger(__name__)
 
@@ -85,6 +79,26 @@ Examples:
         help="Maximum wait time between downloads in seconds (default: 15.0)",
     )
 
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=50,
+        help="Number of videos handed to a single yt-dlp invocation (default: 50)",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Maximum number of batches downloaded simultaneously (default: 1)",
+    )
+
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run yt-dlp in-process through its Python API instead of as a subprocess",
+    )
+
     parser.add_argument(
         "--cookies-from-browser",
         help="Browser to extract cookies from (e.g., chrome, firefox)",
@@ -157,6 +171,8 @@ Examples:
 
 def display_progress_table(progress: DownloadProgress) -> None:
     """Display progress as a rich table."""
+    from rich.table import Table
+
     table = Table(title="Download Progress", show_header=True, header_style="bold magenta")
 
     table.add_column("Metric", style="cyan", no_wrap=True)
@@ -175,7 +191,7 @@ def display_progress_table(progress: DownloadProgress) -> None:
     console.print(table)
 
 
-def run_download(config: AppConfig) -> int:
+def run_download(config: "AppConfig") -> int:
     """
     Run the download process.
 
@@ -185,6 +201,18 @@ def run_download(config: AppConfig) -> int:
     Returns:
         Exit code (0 for success, 1 for error)
     """
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+        TimeElapsedColumn,
+    )
+
+    from ytdlp_subs.application.container import Container
+
+    orchestrator = None
     try:
         # Create container and get orchestrator
         container = Container(config)
@@ -198,21 +226,40 @@ def run_download(config: AppConfig) -> int:
             TaskProgressColumn(),
             TimeElapsedColumn(),
             console=console,
+            refresh_per_second=4,
         ) as progress_bar:
             task = progress_bar.add_task(
                 "[cyan]Downloading subtitles...",
                 total=None,  # Will update when we know total
             )
 
+            last_reported = -1
+
             def progress_callback(prog: DownloadProgress) -> None:
-                """Update progress bar."""
-                if prog.total_videos > 0:
-                    progress_bar.update(
-                        task,
-                        total=prog.total_videos,
-                        completed=prog.processed_videos + prog.skipped_videos,
-                        description=f"[cyan]Processing video {prog.processed_videos + prog.skipped_videos}/{prog.total_videos}",
-                    )
+                """Update progress bar on the first video, every 1% after that and on the last one."""
+                nonlocal last_reported
+                if prog.total_videos <= 0:
+                    return
+
+                # Called once per video (under the orchestrator's progress lock),
+                # so skip updates the bar could not visibly show anyway. Failed
+                # videos count towards the end, so the last report is never skipped.
+                completed = prog.processed_videos + prog.skipped_videos
+                step = max(1, prog.total_videos // 100)
+                if (
+                    last_reported >= 0
+                    and completed - last_reported < step
+                    and completed + prog.failed_videos < prog.total_videos
+                ):
+                    return
+                last_reported = completed
+
+                progress_bar.update(
+                    task,
+                    total=prog.total_videos,
+                    completed=completed,
+                    description=f"[cyan]Processing video {completed}/{prog.total_videos}",
+                )
 
             # Set progress callback
             orchestrator.progress_callback = progress_callback
@@ -256,12 +303,19 @@ def run_download(config: AppConfig) -> int:
         logger.exception("Unexpected error during download")
         return 1
 
+    finally:
+        # Wait for background cache writes, also when the run was interrupted
+        if orchestrator is not None:
+            orchestrator.close()
+
 
 def main() -> NoReturn:
     """Main CLI entry point."""
     parser = create_parser()
     args = parser.parse_args()
 
+    from ytdlp_subs.infrastructure.config import AppConfig
+
     # Create configuration from CLI args
     try:
         config = AppConfig(
@@ -270,6 +324,9 @@ def main() -> NoReturn:
             output_dir=args.output_dir,
             min_wait_seconds=args.min_wait_seconds,
             max_wait_seconds=args.max_wait_seconds,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+            in_process=args.in_process,
             cookies_from_browser=args.cookies_from_browser,
             js_runtimes=args.js_runtimes,
             remote_components=args.remote_components,
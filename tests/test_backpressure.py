@@ -0,0 +1,31 @@
+from ytdlp_subs.application.services.backpressure import BackpressureController
+
+
+def test_throttle_multiplies_wait_up_to_max() -> None:
+    controller = BackpressureController(min_wait=1.0, max_wait=10.0)
+
+    controller.on_throttle()
+    assert controller.current_wait == 2.0
+    controller.on_throttle()
+    controller.on_throttle()
+    controller.on_throttle()
+    assert controller.current_wait == 10.0
+
+
+def test_success_decreases_wait_down_to_min() -> None:
+    controller = BackpressureController(min_wait=1.0, max_wait=10.0, alpha=0.5)
+    controller.current_wait = 2.0
+
+    controller.on_success()
+    assert controller.current_wait == 1.5
+    controller.on_success()
+    controller.on_success()
+    assert controller.current_wait == 1.0
+
+
+def test_throttle_grows_from_zero_minimum() -> None:
+    controller = BackpressureController(min_wait=0.0, max_wait=10.0, alpha=0.5)
+
+    controller.on_throttle()
+
+    assert controller.current_wait == 1.0
@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import pytest
+
+from ytdlp_subs.domain.models import VideoId
+from ytdlp_subs.infrastructure.repositories import FileCacheRepository
+
+VIDEO_IDS = [VideoId("aaaaaaaaaaa"), VideoId("bbbbbbbbbbb")]
+
+
+def test_save_and_load_video_ids(tmp_path: Path) -> None:
+    repository = FileCacheRepository(tmp_path / "cache" / "ids.txt")
+
+    repository.save_video_ids(VIDEO_IDS)
+
+    assert repository.get_cached_video_ids() == VIDEO_IDS
+    assert [p.name for p in (tmp_path / "cache").iterdir()] == ["ids.txt"]
+
+
+def test_interrupted_save_keeps_previous_cache(tmp_path: Path) -> None:
+    repository = FileCacheRepository(tmp_path / "ids.txt")
+    repository.save_video_ids(VIDEO_IDS)
+
+    class Interrupted(Exception):
+        pass
+
+    class ExplodingId:
+        def __str__(self) -> str:
+            raise Interrupted()
+
+    with pytest.raises(Interrupted):
+        repository.save_video_ids([VIDEO_IDS[0], ExplodingId()])  # type: ignore[list-item]
+
+    assert repository.get_cached_video_ids() == VIDEO_IDS
+    assert [p.name for p in tmp_path.iterdir()] == ["ids.txt"]
+
+
+def test_missing_or_blank_cache_is_ignored(tmp_path: Path) -> None:
+    repository = FileCacheRepository(tmp_path / "ids.txt")
+    assert repository.get_cached_video_ids() is None
+
+    (tmp_path / "ids.txt").write_text("\n  aaaaaaaaaaa  \n\n", encoding="utf-8")
+    assert repository.get_cached_video_ids() == [VideoId("aaaaaaaaaaa")]
+
+    repository.save_video_ids([])
+    assert repository.get_cached_video_ids() is None
@@ -0,0 +1,36 @@
+import sys
+
+import pytest
+
+from ytdlp_subs.domain.exceptions import CommandExecutionError
+from ytdlp_subs.infrastructure.command_executor import CommandExecutor
+
+
+def test_execute_streaming_hands_over_each_line() -> None:
+    lines: list[str] = []
+    script = "import sys\nfor line in sys.stdin: print(line.strip().upper())\nprint('done', file=sys.stderr)"
+
+    result = CommandExecutor().execute_streaming(
+        [sys.executable, "-c", script], on_line=lines.append, input_text="a\nb\n"
+    )
+
+    assert lines == ["A", "B"]
+    assert result.success
+    assert result.stdout == ""
+    assert result.stderr.strip() == "done"
+
+
+def test_execute_streaming_raises_on_failure_when_checked() -> None:
+    with pytest.raises(CommandExecutionError) as exc_info:
+        CommandExecutor().execute_streaming(
+            [sys.executable, "-c", "import sys; sys.exit('boom')"], on_line=lambda line: None
+        )
+
+    assert "boom" in exc_info.value.context["stderr"]
+
+
+def test_execute_streaming_kills_command_on_timeout() -> None:
+    with pytest.raises(CommandExecutionError, match="timed out"):
+        CommandExecutor(timeout=1).execute_streaming(
+            [sys.executable, "-c", "import time; time.sleep(30)"], on_line=lambda line: None
+        )
@@ -0,0 +1,286 @@
+from pathlib import Path
+from typing import Callable, Optional
+
+from ytdlp_subs.application.services.file_processor import SubtitleFileProcessor
+from ytdlp_subs.application.services.filename_generator import FilenameGenerator
+from ytdlp_subs.application.use_cases.download_orchestrator import DownloadOrchestrator
+from ytdlp_subs.domain.exceptions import CacheError, DownloadError
+from ytdlp_subs.domain.models import (
+    SubtitleDownloadResult,
+    SubtitleFile,
+    SubtitleFormat,
+    SubtitleLanguage,
+    VideoId,
+    VideoMetadata,
+)
+from ytdlp_subs.domain.repositories import (
+    ICacheRepository,
+    IErrorRepository,
+    ISubtitleRepository,
+    IVideoRepository,
+)
+from ytdlp_subs.domain.services import ISubtitleDownloaderService
+
+VIDEO_IDS = [VideoId(c * 11) for c in "abcde"]
+
+
+class FakeVideoRepository(IVideoRepository):
+    def __init__(self) -> None:
+        self.channel_fetches = 0
+
+    def get_video_metadata(self, video_id: VideoId) -> Optional[VideoMetadata]:
+        return VideoMetadata(video_id=video_id, title=f"Title {video_id}")
+
+    def get_channel_video_ids(self, channel_url: str) -> list[VideoId]:
+        self.channel_fetches += 1
+        return list(VIDEO_IDS)
+
+
+class FakeSubtitleRepository(ISubtitleRepository):
+    def __init__(self, downloaded: set[VideoId]) -> None:
+        self.downloaded = downloaded
+        self.saved: list[SubtitleFile] = []
+
+    def save_subtitle(self, subtitle: SubtitleFile) -> None:
+        self.saved.append(subtitle)
+
+    def get_subtitle(self, video_id: VideoId, language: str, format: str) -> Optional[SubtitleFile]:
+        return None
+
+    def subtitle_exists(self, video_id: VideoId) -> bool:
+        return video_id in self.downloaded
+
+    def get_downloaded_video_ids(self) -> set[VideoId]:
+        return set(self.downloaded)
+
+
+class FakeCacheRepository(ICacheRepository):
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.saved: list[list[VideoId]] = []
+
+    def get_cached_video_ids(self) -> Optional[list[VideoId]]:
+        return None
+
+    def save_video_ids(self, video_ids: list[VideoId]) -> None:
+        if self.fail:
+            raise CacheError("disk full")
+        self.saved.append(list(video_ids))
+
+    def clear_cache(self) -> None:
+        pass
+
+    def cache_exists(self) -> bool:
+        return False
+
+
+class FakeErrorRepository(IErrorRepository):
+    def __init__(self) -> None:
+        self.errors: dict[VideoId, str] = {}
+
+    def get_failed_video_ids(self) -> set[VideoId]:
+        return set(self.errors)
+
+    def record_error(self, video_id: VideoId, error_type: str, error_message: str) -> None:
+        self.errors[video_id] = error_type
+
+
+class FakeSubtitleDownloader(ISubtitleDownloaderService):
+    """Serves English for every video except 'c…' (none) and 'd…' (failure).
+
+    Only 'e…' comes back with the title yt-dlp printed.
+    """
+
+    def __init__(self) -> None:
+        self.batches: list[tuple[list[VideoId], list[SubtitleLanguage]]] = []
+
+    def download_subtitle(
+        self, video_id: VideoId, language: SubtitleLanguage, output_dir: Path
+    ) -> Optional[SubtitleFile]:
+        raise NotImplementedError
+
+    def download_subtitles_batch(
+        self,
+        video_ids: list[VideoId],
+        languages: list[SubtitleLanguage],
+        output_dir: Path,
+        on_subtitle: Optional[Callable[[SubtitleFile], None]] = None,
+    ) -> dict[VideoId, SubtitleDownloadResult]:
+        self.batches.append((list(video_ids), list(languages)))
+        results = {}
+        for video_id in video_ids:
+            if str(video_id).startswith("d"):
+                results[video_id] = SubtitleDownloadResult(
+                    video_id=video_id, error=DownloadError("boom")
+                )
+            elif SubtitleLanguage.ENGLISH in languages and not str(video_id).startswith("c"):
+                temp = output_dir / f"{video_id}.temp.en.vtt"
+                temp.write_text("WEBVTT\n", encoding="utf-8")
+                subtitle_file = SubtitleFile(
+                    video_id=video_id,
+                    language=SubtitleLanguage.ENGLISH,
+                    format=SubtitleFormat.VTT,
+                    file_path=temp,
+                    size_bytes=7,
+                    title="Printed title" if str(video_id).startswith("e") else None,
+                )
+                results[video_id] = SubtitleDownloadResult(
+                    video_id=video_id, subtitle_file=subtitle_file
+                )
+                # Stream only the first video of each batch, like a batch in progress
+                if on_subtitle is not None and video_id == video_ids[0]:
+                    on_subtitle(subtitle_file)
+            else:
+                results[video_id] = SubtitleDownloadResult(video_id=video_id)
+        return results
+
+
+def make_orchestrator(
+    downloaded: set[VideoId], batch_size: int = 2
+) -> tuple[DownloadOrchestrator, FakeSubtitleDownloader, FakeSubtitleRepository, FakeErrorRepository]:
+    downloader = FakeSubtitleDownloader()
+    subtitle_repository = FakeSubtitleRepository(downloaded)
+    error_repository = FakeErrorRepository()
+    orchestrator = DownloadOrchestrator(
+        video_repository=FakeVideoRepository(),
+        subtitle_repository=subtitle_repository,
+        cache_repository=FakeCacheRepository(),
+        error_repository=error_repository,
+        subtitle_downloader=downloader,
+        file_processor=SubtitleFileProcessor(),
+        filename_generator=FilenameGenerator(),
+        language_preferences=[SubtitleLanguage.HINDI, SubtitleLanguage.ENGLISH],
+        min_wait_seconds=0.0,
+        max_wait_seconds=0.0,
+        batch_size=batch_size,
+    )
+    return orchestrator, downloader, subtitle_repository, error_repository
+
+
+def test_execute_downloads_pending_videos_in_batches(tmp_path: Path) -> None:
+    orchestrator, downloader, subtitle_repository, error_repository = make_orchestrator(
+        downloaded={VIDEO_IDS[0]}
+    )
+
+    progress = orchestrator.execute("https://www.youtube.com/@channel", tmp_path)
+
+    assert progress.total_videos == 5
+    assert progress.skipped_videos == 1
+    assert progress.failed_videos == 1
+    assert progress.processed_videos == 3
+    assert set(error_repository.errors) == {VIDEO_IDS[3]}
+    assert sorted(str(s.video_id) for s in subtitle_repository.saved) == ["bbbbbbbbbbb", "eeeeeeeeeee"]
+    # Every language preference is requested in the same invocation
+    preferences = [SubtitleLanguage.HINDI, SubtitleLanguage.ENGLISH]
+    assert downloader.batches == [(VIDEO_IDS[1:3], preferences), (VIDEO_IDS[3:5], preferences)]
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "2_bbbbbbbbbbb_Title bbbbbbbbbbb.en.vtt",
+        "5_eeeeeeeeeee_Printed title.en.vtt",
+    ]
+
+
+def test_execute_with_concurrent_workers_processes_every_batch(tmp_path: Path) -> None:
+    orchestrator, downloader, subtitle_repository, error_repository = make_orchestrator(
+        downloaded=set(), batch_size=50
+    )
+    orchestrator.concurrency = 3
+
+    progress = orchestrator.execute("https://www.youtube.com/@channel", tmp_path)
+
+    # Five videos are spread over the three workers instead of one full batch
+    assert sorted(len(batch) for batch, _ in downloader.batches) == [1, 2, 2]
+
+    assert progress.processed_videos == 4
+    assert progress.failed_videos == 1
+    assert set(error_repository.errors) == {VIDEO_IDS[3]}
+    assert len(subtitle_repository.saved) == 3
+    assert len(list(tmp_path.iterdir())) == 3
+
+
+def test_execute_overwrites_leftover_target_file(tmp_path: Path) -> None:
+    orchestrator, _, subtitle_repository, _ = make_orchestrator(downloaded=set(), batch_size=5)
+    leftover = tmp_path / "2_bbbbbbbbbbb_Title bbbbbbbbbbb.en.vtt"
+    leftover.write_text("stale", encoding="utf-8")
+
+    orchestrator.execute("https://www.youtube.com/@channel", tmp_path)
+
+    assert leftover.read_text(encoding="utf-8") == "WEBVTT\n"
+    assert not list(tmp_path.glob("*.temp.*"))
+
+
+def test_execute_ignores_downloaded_ids_outside_the_channel(tmp_path: Path) -> None:
+    orchestrator, downloader, _, _ = make_orchestrator(
+        downloaded={VIDEO_IDS[0], VideoId("zzzzzzzzzzz")}, batch_size=5
+    )
+
+    progress = orchestrator.execute("https://www.youtube.com/@channel", tmp_path)
+
+    assert progress.skipped_videos == 1
+    assert [batch for batch, _ in downloader.batches] == [VIDEO_IDS[1:]]
+
+
+def test_channel_video_ids_are_fetched_once_per_process(tmp_path: Path) -> None:
+    orchestrator, _, _, _ = make_orchestrator(downloaded=set(VIDEO_IDS))
+
+    orchestrator.execute("https://www.youtube.com/@channel", tmp_path)
+    orchestrator.execute("https://www.youtube.com/@channel", tmp_path)
+
+    assert orchestrator.video_repository.channel_fetches == 1
+
+
+def test_least_recently_used_channel_is_evicted(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(DownloadOrchestrator, "CHANNEL_CACHE_SIZE", 2)
+    orchestrator, _, _, _ = make_orchestrator(downloaded=set(VIDEO_IDS))
+
+    for channel in ("a", "b", "a", "c", "a", "b"):
+        orchestrator.execute(f"https://www.youtube.com/@{channel}", tmp_path)
+    orchestrator.close()
+
+    # "b" was evicted by "c" because "a" had been used more recently
+    assert orchestrator.video_repository.channel_fetches == 4
+    assert list(orchestrator._channel_video_ids) == [
+        "https://www.youtube.com/@a",
+        "https://www.youtube.com/@b",
+    ]
+
+
+def test_force_refresh_fetches_channel_video_ids_every_run(tmp_path: Path) -> None:
+    orchestrator, _, _, _ = make_orchestrator(downloaded=set(VIDEO_IDS))
+    orchestrator.force_refresh = True
+
+    orchestrator.execute("https://www.youtube.com/@channel", tmp_path)
+    orchestrator.execute("https://www.youtube.com/@channel", tmp_path)
+    orchestrator.close()
+
+    assert orchestrator.video_repository.channel_fetches == 2
+
+
+def test_channel_video_ids_are_cached_in_the_background(tmp_path: Path) -> None:
+    orchestrator, _, _, _ = make_orchestrator(downloaded=set(VIDEO_IDS))
+
+    orchestrator.execute("https://www.youtube.com/@channel", tmp_path)
+    orchestrator.close()
+
+    assert orchestrator.cache_repository.saved == [VIDEO_IDS]
+
+
+def test_execute_after_close_still_caches_fetched_video_ids(tmp_path: Path) -> None:
+    orchestrator, _, _, _ = make_orchestrator(downloaded=set(VIDEO_IDS))
+    orchestrator.force_refresh = True
+
+    orchestrator.execute("https://www.youtube.com/@channel", tmp_path)
+    orchestrator.close()
+    orchestrator.execute("https://www.youtube.com/@channel", tmp_path)
+    orchestrator.close()
+
+    assert orchestrator.cache_repository.saved == [VIDEO_IDS, VIDEO_IDS]
+
+
+def test_cache_write_failure_does_not_abort_the_run(tmp_path: Path) -> None:
+    orchestrator, _, _, _ = make_orchestrator(downloaded=set(), batch_size=5)
+    orchestrator.cache_repository.fail = True
+
+    progress = orchestrator.execute("https://www.youtube.com/@channel", tmp_path)
+    orchestrator.close()
+
+    assert progress.processed_videos == 4
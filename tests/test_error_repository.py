@@ -0,0 +1,62 @@
+import csv
+from pathlib import Path
+
+from ytdlp_subs.domain.models import VideoId
+from ytdlp_subs.infrastructure.repositories.error_repository import FileErrorRepository
+
+
+def read_rows(path: Path) -> list[list[str]]:
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def test_errors_are_buffered_until_flush_and_deduplicated(tmp_path: Path) -> None:
+    error_log = tmp_path / "errors.csv"
+    repository = FileErrorRepository(error_log)
+    video_id = VideoId("aaaaaaaaaaa")
+
+    repository.record_error(video_id, "DownloadError", "boom")
+    repository.record_error(video_id, "DownloadError", "boom again")
+    assert len(read_rows(error_log)) == 1
+
+    repository.flush()
+
+    assert read_rows(error_log)[1] == [str(video_id), video_id.url, "DownloadError", "boom"]
+    assert len(read_rows(error_log)) == 2
+    assert repository.get_failed_video_ids() == {video_id}
+    repository.close()
+
+
+def test_failed_ids_are_loaded_from_existing_log(tmp_path: Path) -> None:
+    error_log = tmp_path / "errors.csv"
+    first = FileErrorRepository(error_log)
+    first.record_error(VideoId("aaaaaaaaaaa"), "DownloadError", "boom")
+    first.close()
+
+    second = FileErrorRepository(error_log)
+    second.record_error(VideoId("aaaaaaaaaaa"), "DownloadError", "boom")
+    second.close()
+
+    assert second.get_failed_video_ids() == {VideoId("aaaaaaaaaaa")}
+    assert len(read_rows(error_log)) == 2
+
+
+def test_failed_ids_are_read_from_video_id_column(tmp_path: Path) -> None:
+    error_log = tmp_path / "errors.csv"
+    error_log.write_text(
+        "Error Type,Video ID\nDownloadError,aaaaaaaaaaa\nDownloadError,\n", encoding="utf-8"
+    )
+
+    assert FileErrorRepository(error_log).get_failed_video_ids() == {VideoId("aaaaaaaaaaa")}
+
+
+def test_errors_are_flushed_every_interval(tmp_path: Path) -> None:
+    error_log = tmp_path / "errors.csv"
+    repository = FileErrorRepository(error_log, flush_interval=2)
+
+    repository.record_error(VideoId("aaaaaaaaaaa"), "DownloadError", "boom")
+    assert len(read_rows(error_log)) == 1
+
+    repository.record_error(VideoId("bbbbbbbbbbb"), "DownloadError", "boom")
+    assert len(read_rows(error_log)) == 3
+    repository.close()
@@ -0,0 +1,32 @@
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from ytdlp_subs.infrastructure import file_io
+from ytdlp_subs.infrastructure.file_io import atomic_write
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="POSIX file modes")
+
+
+def test_atomic_write_creates_file_with_umask_default_mode(tmp_path: Path) -> None:
+    target = tmp_path / "cache.txt"
+
+    with atomic_write(target) as f:
+        f.write("aaaaaaaaaaa\n")
+
+    assert stat.S_IMODE(target.stat().st_mode) == 0o666 & ~file_io._UMASK
+    assert target.read_text(encoding="utf-8") == "aaaaaaaaaaa\n"
+
+
+def test_atomic_write_keeps_mode_of_replaced_file(tmp_path: Path) -> None:
+    target = tmp_path / "cache.txt"
+    target.write_text("old\n", encoding="utf-8")
+    target.chmod(0o640)
+
+    with atomic_write(target) as f:
+        f.write("new\n")
+
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+    assert target.read_text(encoding="utf-8") == "new\n"
@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import pytest
+
+from ytdlp_subs.application.services.file_processor import SubtitleFileProcessor
+from ytdlp_subs.domain.exceptions import FileProcessingError
+
+VTT = """WEBVTT
+Kind: captions
+Language: en
+
+1
+00:00:00.000 --> 00:00:02.000 align:start position:0%
+Hello<00:00:00.500><c> world</c>
+
+00:00:02.000 --> 00:00:04.000
+Hello world
+
+00:00:04.000 --> 00:00:06.000
+Second line
+"""
+
+
+def test_clean_vtt_to_txt_strips_markup_and_duplicates(tmp_path: Path) -> None:
+    vtt_file = tmp_path / "video.en.vtt"
+    vtt_file.write_text(VTT, encoding="utf-8")
+
+    txt_file = SubtitleFileProcessor().clean_vtt_to_txt(vtt_file)
+
+    assert txt_file == tmp_path / "video.en.txt"
+    assert txt_file.read_text(encoding="utf-8") == "Hello world\nSecond line"
+    assert not vtt_file.exists()
+
+
+def test_clean_vtt_to_txt_keeps_non_ascii_text(tmp_path: Path) -> None:
+    vtt_file = tmp_path / "video.hi.vtt"
+    vtt_file.write_text(
+        "WEBVTT\r\n\r\n00:00:00.000 --> 00:00:02.000\r\n<c>नमस्ते</c> दुनिया\r\n", encoding="utf-8"
+    )
+
+    txt_file = SubtitleFileProcessor().clean_vtt_to_txt(vtt_file)
+
+    assert txt_file.read_text(encoding="utf-8") == "नमस्ते दुनिया"
+
+
+def test_clean_vtt_to_txt_strips_non_ascii_whitespace(tmp_path: Path) -> None:
+    vtt_file = tmp_path / "video.hi.vtt"
+    vtt_file.write_text(
+        "WEBVTT\n\n00:00:00.000 --> 00:00:02.000\nhello world\n"
+        "second line\u00a0\n\u00a0\n\u3000१२\u3000\n\nfinal\n",
+        encoding="utf-8",
+    )
+
+    txt_file = SubtitleFileProcessor().clean_vtt_to_txt(vtt_file)
+
+    assert txt_file.read_text(encoding="utf-8") == "hello world\nsecond line\nfinal"
+
+
+def test_clean_vtt_to_txt_reports_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(FileProcessingError, match="does not exist"):
+        SubtitleFileProcessor().clean_vtt_to_txt(tmp_path / "missing.en.vtt")
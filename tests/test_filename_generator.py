@@ -0,0 +1,46 @@
+from ytdlp_subs.application.services.filename_generator import FilenameGenerator, sanitize_title
+from ytdlp_subs.domain.models import SubtitleFormat, SubtitleLanguage, VideoId, VideoMetadata
+
+
+def test_sanitize_title_removes_invalid_characters() -> None:
+    assert sanitize_title(' What? A "Title": part 1/2 ') == "What A Title part 12"
+
+
+def test_sanitize_title_truncates_and_replaces_empty_titles() -> None:
+    assert len(sanitize_title("x" * 300)) == 100
+    assert sanitize_title(" <>| ") == "UnknownTitle"
+
+
+def test_generate_filename_pads_index_to_total_count() -> None:
+    metadata = VideoMetadata(video_id=VideoId("aaaaaaaaaaa"), title="Intro: Part 1")
+
+    filename = FilenameGenerator().generate_filename(
+        metadata, SubtitleLanguage.ENGLISH, SubtitleFormat.VTT, index=7, total_count=250
+    )
+
+    assert filename == "007_aaaaaaaaaaa_Intro Part 1.en.vtt"
+
+
+def test_generate_filename_recomputes_padding_when_total_changes() -> None:
+    generator = FilenameGenerator()
+    metadata = VideoMetadata(video_id=VideoId("aaaaaaaaaaa"), title="Title")
+
+    first = generator.generate_filename(
+        metadata, SubtitleLanguage.ENGLISH, SubtitleFormat.VTT, index=3, total_count=50
+    )
+    second = generator.generate_filename(
+        metadata, SubtitleLanguage.ENGLISH, SubtitleFormat.VTT, index=3, total_count=5000
+    )
+
+    assert first.startswith("03_")
+    assert second.startswith("0003_")
+
+
+def test_generate_filename_pads_to_four_digits_without_total() -> None:
+    metadata = VideoMetadata(video_id=VideoId("aaaaaaaaaaa"), title="Title")
+
+    filename = FilenameGenerator().generate_filename(
+        metadata, SubtitleLanguage.ENGLISH, SubtitleFormat.VTT, index=12
+    )
+
+    assert filename.startswith("0012_")
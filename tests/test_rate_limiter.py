@@ -0,0 +1,43 @@
+from ytdlp_subs.application.services import rate_limiter
+from ytdlp_subs.application.services.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def test_burst_is_served_without_waiting(monkeypatch) -> None:
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", clock.monotonic)
+    bucket = TokenBucket(interval=10.0, capacity=2)
+
+    bucket.acquire()
+    bucket.acquire()
+
+    assert bucket._tokens == 0
+
+
+def test_tokens_refill_with_elapsed_time(monkeypatch) -> None:
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", clock.monotonic)
+    bucket = TokenBucket(interval=2.0, capacity=1)
+    bucket.acquire()
+
+    clock.now = 1.0
+    bucket._refill()
+    assert bucket._tokens == 0.5
+
+    clock.now = 5.0
+    bucket.acquire()
+    assert bucket._tokens == 0
+
+
+def test_zero_interval_never_blocks() -> None:
+    bucket = TokenBucket(interval=0.0)
+
+    for _ in range(100):
+        bucket.acquire()
@@ -0,0 +1,261 @@
+import json
+from pathlib import Path
+from typing import Callable, Optional
+
+from ytdlp_subs.application.services.subtitle_downloader import YtDlpSubtitleDownloader
+from ytdlp_subs.domain.exceptions import CommandExecutionError, RateLimitError
+from ytdlp_subs.domain.models import SubtitleFile, SubtitleLanguage, VideoId
+from ytdlp_subs.infrastructure.command_executor import CommandExecutor, CommandResult
+
+
+class FakeCommandExecutor(CommandExecutor):
+    def __init__(self, stdout: str, stderr: str = "", return_code: int = 0) -> None:
+        super().__init__()
+        self.stdout = stdout
+        self.stderr = stderr
+        self.return_code = return_code
+        self.calls: list[tuple[list[str], Optional[str]]] = []
+        self.timeouts: list[Optional[float]] = []
+
+    def execute(
+        self,
+        command: list[str],
+        check: bool = True,
+        capture_output: bool = True,
+        input_text: Optional[str] = None,
+    ) -> CommandResult:
+        self.calls.append((command, input_text))
+        return CommandResult(self.stdout, self.stderr, self.return_code, command)
+
+    def execute_streaming(
+        self,
+        command: list[str],
+        on_line: Callable[[str], None],
+        check: bool = True,
+        input_text: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> CommandResult:
+        self.timeouts.append(timeout)
+        result = self.execute(command, check=check, input_text=input_text)
+        for line in result.stdout.splitlines():
+            on_line(line)
+        return CommandResult("", result.stderr, result.return_code, command)
+
+
+def test_batch_download_maps_results_per_video(tmp_path: Path) -> None:
+    ok, missing, broken = VideoId("aaaaaaaaaaa"), VideoId("bbbbbbbbbbb"), VideoId("ccccccccccc")
+    (tmp_path / "aaaaaaaaaaa.temp.en.vtt").write_text("WEBVTT\n", encoding="utf-8")
+    stdout = "\n".join(
+        [
+            json.dumps(
+                {"id": "aaaaaaaaaaa", "title": "Intro", "requested_subtitles": {"en": {"ext": "vtt"}}}
+            ),
+            json.dumps({"id": "bbbbbbbbbbb", "requested_subtitles": None}),
+        ]
+    )
+    stderr = "ERROR: [youtube] ccccccccccc: Video unavailable\n"
+    executor = FakeCommandExecutor(stdout, stderr, return_code=1)
+    downloader = YtDlpSubtitleDownloader(command_executor=executor)
+
+    streamed: list[SubtitleFile] = []
+
+    results = downloader.download_subtitles_batch(
+        [ok, missing, broken], [SubtitleLanguage.ENGLISH], tmp_path, on_subtitle=streamed.append
+    )
+
+    assert results[ok].subtitle_file is not None
+    assert results[ok].subtitle_file.file_path.name == "aaaaaaaaaaa.temp.en.vtt"
+    assert results[ok].subtitle_file.title == "Intro"
+    assert streamed == [results[ok].subtitle_file]
+    assert results[missing].subtitle_file is None and not results[missing].failed
+    assert results[broken].failed
+    assert "Video unavailable" in results[broken].error.message
+
+    command, urls = executor.calls[0]
+    assert command[-2:] == ["--batch-file", "-"]
+    assert urls == "".join(f"{vid.url}\n" for vid in (ok, missing, broken))
+    # Failed video is retried alone with the Android client fallback
+    retry_command, retry_urls = executor.calls[1]
+    assert "youtube:player_client=android" in retry_command
+    assert retry_urls == f"{broken.url}\n"
+
+
+class ScriptedCommandExecutor(FakeCommandExecutor):
+    def __init__(self, results: list[tuple[str, str]]) -> None:
+        super().__init__(stdout="")
+        self.results = results
+        self.calls: list[Optional[str]] = []
+
+    def execute(
+        self,
+        command: list[str],
+        check: bool = True,
+        capture_output: bool = True,
+        input_text: Optional[str] = None,
+    ) -> CommandResult:
+        self.calls.append(input_text)
+        stdout, stderr = self.results.pop(0)
+        return CommandResult(stdout, stderr, 1 if stderr else 0, command)
+
+
+def test_batch_download_retries_transient_failures(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    video_id = VideoId("aaaaaaaaaaa")
+    (tmp_path / "aaaaaaaaaaa.temp.en.vtt").write_text("WEBVTT\n", encoding="utf-8")
+    throttled = "ERROR: [youtube] aaaaaaaaaaa: HTTP Error 429: Too Many Requests\n"
+    success = json.dumps({"id": "aaaaaaaaaaa", "requested_subtitles": {"en": {"ext": "vtt"}}})
+    executor = ScriptedCommandExecutor([("", throttled), ("", throttled), (success, "")])
+    downloader = YtDlpSubtitleDownloader(command_executor=executor, retry_base_wait=0.0)
+
+    results = downloader.download_subtitles_batch([video_id], [SubtitleLanguage.ENGLISH], tmp_path)
+
+    assert results[video_id].subtitle_file is not None
+    assert len(executor.calls) == 3
+
+
+def test_batch_download_waits_for_retry_after(tmp_path: Path, monkeypatch) -> None:
+    waits: list[float] = []
+    monkeypatch.setattr("time.sleep", waits.append)
+    video_id = VideoId("aaaaaaaaaaa")
+    (tmp_path / "aaaaaaaaaaa.temp.en.vtt").write_text("WEBVTT\n", encoding="utf-8")
+    throttled = "ERROR: [youtube] aaaaaaaaaaa: HTTP Error 429: Too Many Requests (Retry-After: 30)\n"
+    success = json.dumps({"id": "aaaaaaaaaaa", "requested_subtitles": {"en": {"ext": "vtt"}}})
+    executor = ScriptedCommandExecutor([("", throttled), ("", throttled), (success, "")])
+    downloader = YtDlpSubtitleDownloader(command_executor=executor, retry_base_wait=0.0)
+
+    results = downloader.download_subtitles_batch([video_id], [SubtitleLanguage.ENGLISH], tmp_path)
+
+    assert results[video_id].subtitle_file is not None
+    assert waits == [30.0]
+
+
+def test_batch_download_does_not_retry_permanent_failures(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    video_id = VideoId("aaaaaaaaaaa")
+    unavailable = "ERROR: [youtube] aaaaaaaaaaa: Private video\n"
+    executor = ScriptedCommandExecutor([("", unavailable), ("", unavailable)])
+    downloader = YtDlpSubtitleDownloader(command_executor=executor)
+
+    results = downloader.download_subtitles_batch([video_id], [SubtitleLanguage.ENGLISH], tmp_path)
+
+    assert results[video_id].failed
+    # Only the Android client fallback, no backoff retries
+    assert len(executor.calls) == 2
+
+
+def test_batch_download_keeps_most_preferred_language(tmp_path: Path) -> None:
+    video_id = VideoId("aaaaaaaaaaa")
+    for lang in ("hi", "en"):
+        (tmp_path / f"aaaaaaaaaaa.temp.{lang}.vtt").write_text("WEBVTT\n", encoding="utf-8")
+    stdout = json.dumps(
+        {"id": "aaaaaaaaaaa", "requested_subtitles": {"en": {"ext": "vtt"}, "hi": {"ext": "vtt"}}}
+    )
+    executor = FakeCommandExecutor(stdout)
+    downloader = YtDlpSubtitleDownloader(command_executor=executor)
+
+    results = downloader.download_subtitles_batch(
+        [video_id], [SubtitleLanguage.HINDI, SubtitleLanguage.ENGLISH], tmp_path
+    )
+
+    assert results[video_id].subtitle_file.language is SubtitleLanguage.HINDI
+    assert [p.name for p in tmp_path.iterdir()] == ["aaaaaaaaaaa.temp.hi.vtt"]
+    command, _ = executor.calls[0]
+    assert command[command.index("--sub-langs") + 1] == "hi,en"
+    assert "--no-progress" in command and "--ignore-no-formats-error" in command
+
+
+def test_batch_download_reports_missing_subtitle_file(tmp_path: Path) -> None:
+    video_id = VideoId("aaaaaaaaaaa")
+    stdout = json.dumps({"id": "aaaaaaaaaaa", "requested_subtitles": {"en": {"ext": "vtt"}}})
+    downloader = YtDlpSubtitleDownloader(command_executor=FakeCommandExecutor(stdout))
+
+    results = downloader.download_subtitles_batch([video_id], [SubtitleLanguage.ENGLISH], tmp_path)
+
+    assert results[video_id].failed
+    assert "not found" in results[video_id].error.message
+
+
+def test_batch_download_treats_throttled_subtitle_fetch_as_rate_limit(tmp_path: Path) -> None:
+    video_id = VideoId("aaaaaaaaaaa")
+    listed = json.dumps({"id": "aaaaaaaaaaa", "requested_subtitles": {"en": {"ext": "vtt"}}})
+    throttled = (
+        "WARNING: [youtube] aaaaaaaaaaa: Unable to download video subtitles for 'en': "
+        "HTTP Error 429: Too Many Requests\n"
+    )
+    executor = ScriptedCommandExecutor([(listed, throttled), (listed, throttled)])
+    downloader = YtDlpSubtitleDownloader(command_executor=executor, max_retries=0)
+
+    results = downloader.download_subtitles_batch([video_id], [SubtitleLanguage.ENGLISH], tmp_path)
+
+    assert isinstance(results[video_id].error, RateLimitError)
+    assert "HTTP Error 429" in results[video_id].error.message
+    # The Android client fallback retried the throttled video
+    assert len(executor.calls) == 2
+
+
+def test_single_download_ignores_output_after_the_json_line(tmp_path: Path) -> None:
+    video_id = VideoId("aaaaaaaaaaa")
+    (tmp_path / "aaaaaaaaaaa.temp.en.vtt").write_text("WEBVTT\n", encoding="utf-8")
+    stdout = "\n".join(
+        [
+            json.dumps({"id": "aaaaaaaaaaa", "requested_subtitles": {"en": {"ext": "vtt"}}}),
+            "WARNING: trailing note",
+        ]
+    )
+    downloader = YtDlpSubtitleDownloader(command_executor=FakeCommandExecutor(stdout))
+
+    subtitle_file = downloader.download_subtitle(video_id, SubtitleLanguage.ENGLISH, tmp_path)
+
+    assert subtitle_file is not None
+    assert subtitle_file.file_path == tmp_path / "aaaaaaaaaaa.temp.en.vtt"
+
+
+class TimingOutCommandExecutor(FakeCommandExecutor):
+    """Streams its output, then reports a timeout like the real executor."""
+
+    def execute_streaming(
+        self,
+        command: list[str],
+        on_line: Callable[[str], None],
+        check: bool = True,
+        input_text: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> CommandResult:
+        super().execute_streaming(command, on_line, check, input_text, timeout)
+        raise CommandExecutionError("Command timed out", command=command, timeout=timeout)
+
+
+def test_timed_out_batch_keeps_results_already_reported(tmp_path: Path) -> None:
+    done, pending = VideoId("aaaaaaaaaaa"), VideoId("bbbbbbbbbbb")
+    (tmp_path / "aaaaaaaaaaa.temp.en.vtt").write_text("WEBVTT\n", encoding="utf-8")
+    stdout = json.dumps({"id": "aaaaaaaaaaa", "requested_subtitles": {"en": {"ext": "vtt"}}})
+    executor = TimingOutCommandExecutor(stdout)
+    downloader = YtDlpSubtitleDownloader(command_executor=executor, max_retries=0)
+    executor.timeout = 300
+    streamed: list[SubtitleFile] = []
+
+    results = downloader.download_subtitles_batch(
+        [done, pending], [SubtitleLanguage.ENGLISH], tmp_path, on_subtitle=streamed.append
+    )
+
+    assert [s.video_id for s in streamed] == [done]
+    assert results[done].subtitle_file is not None
+    assert results[pending].failed
+    # Only the unreported video goes to the Android fallback
+    assert [urls for _, urls in executor.calls] == [
+        f"{done.url}\n{pending.url}\n",
+        f"{pending.url}\n",
+    ]
+    # The per-video timeout is scaled to the batch
+    assert executor.timeouts == [600, 300]
+
+
+def test_batch_download_reports_unsupported_subtitle_format(tmp_path: Path) -> None:
+    video_id = VideoId("aaaaaaaaaaa")
+    stdout = json.dumps({"id": "aaaaaaaaaaa", "requested_subtitles": {"en": {"ext": "ttml"}}})
+    downloader = YtDlpSubtitleDownloader(command_executor=FakeCommandExecutor(stdout))
+
+    results = downloader.download_subtitles_batch([video_id], [SubtitleLanguage.ENGLISH], tmp_path)
+
+    assert results[video_id].failed
+    assert "Unsupported subtitle format" in results[video_id].error.message
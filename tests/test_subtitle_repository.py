@@ -0,0 +1,111 @@
+import json
+from pathlib import Path
+
+from ytdlp_subs.domain.models import SubtitleFile, SubtitleFormat, SubtitleLanguage, VideoId
+from ytdlp_subs.infrastructure.repositories import FileSystemSubtitleRepository
+
+
+def make_subtitle(output_dir: Path, name: str) -> SubtitleFile:
+    file_path = output_dir / name
+    file_path.write_text("WEBVTT\n", encoding="utf-8")
+    return SubtitleFile(
+        video_id=VideoId(name.split("_")[1]),
+        language=SubtitleLanguage.ENGLISH,
+        format=SubtitleFormat.VTT,
+        file_path=file_path,
+        size_bytes=7,
+    )
+
+
+def test_downloaded_ids_are_served_from_index_while_directory_is_unchanged(tmp_path: Path) -> None:
+    (tmp_path / "1_aaaaaaaaaaa_Title.en.vtt").write_text("WEBVTT\n", encoding="utf-8")
+    FileSystemSubtitleRepository(tmp_path).get_downloaded_video_ids()
+
+    # Tamper with the index only; the directory mtime still matches
+    index_file = tmp_path / FileSystemSubtitleRepository.INDEX_FILENAME
+    data = json.loads(index_file.read_text(encoding="utf-8"))
+    data["video_ids"].append("zzzzzzzzzzz")
+    index_file.write_text(json.dumps(data), encoding="utf-8")
+
+    assert FileSystemSubtitleRepository(tmp_path).get_downloaded_video_ids() == {
+        VideoId("aaaaaaaaaaa"),
+        VideoId("zzzzzzzzzzz"),
+    }
+
+
+def test_directory_is_rescanned_when_files_change(tmp_path: Path) -> None:
+    FileSystemSubtitleRepository(tmp_path).get_downloaded_video_ids()
+
+    (tmp_path / "bbbbbbbbbbb_Title.en.vtt").write_text("WEBVTT\n", encoding="utf-8")
+
+    assert FileSystemSubtitleRepository(tmp_path).get_downloaded_video_ids() == {
+        VideoId("bbbbbbbbbbb")
+    }
+
+
+def test_saved_subtitles_are_flushed_to_index(tmp_path: Path) -> None:
+    repository = FileSystemSubtitleRepository(tmp_path)
+    repository.get_downloaded_video_ids()
+
+    repository.save_subtitle(make_subtitle(tmp_path, "1_ccccccccccc_Title.en.vtt"))
+    repository.flush()
+
+    index_file = tmp_path / FileSystemSubtitleRepository.INDEX_FILENAME
+    data = json.loads(index_file.read_text(encoding="utf-8"))
+    assert data["video_ids"] == ["ccccccccccc"]
+    assert data["dir_mtime_ns"] == tmp_path.stat().st_mtime_ns
+
+
+def test_index_is_only_rewritten_on_flush(tmp_path: Path) -> None:
+    repository = FileSystemSubtitleRepository(tmp_path)
+    repository.get_downloaded_video_ids()
+    index_file = tmp_path / FileSystemSubtitleRepository.INDEX_FILENAME
+
+    for index, video_id in enumerate(["ccccccccccc", "ddddddddddd"], start=1):
+        repository.save_subtitle(make_subtitle(tmp_path, f"{index}_{video_id}_Title.en.vtt"))
+    assert json.loads(index_file.read_text(encoding="utf-8"))["video_ids"] == []
+
+    repository.flush()
+    assert json.loads(index_file.read_text(encoding="utf-8"))["video_ids"] == [
+        "ccccccccccc",
+        "ddddddddddd",
+    ]
+
+
+def test_downloaded_ids_are_loaded_once_and_kept_current(tmp_path: Path) -> None:
+    repository = FileSystemSubtitleRepository(tmp_path)
+    assert repository.get_downloaded_video_ids() == set()
+
+    repository.save_subtitle(make_subtitle(tmp_path, "1_ddddddddddd_Title.en.vtt"))
+    (tmp_path / FileSystemSubtitleRepository.INDEX_FILENAME).unlink()
+
+    assert repository.get_downloaded_video_ids() == {VideoId("ddddddddddd")}
+
+
+def test_bulk_save_is_indexed_on_flush(tmp_path: Path) -> None:
+    repository = FileSystemSubtitleRepository(tmp_path)
+    repository.get_downloaded_video_ids()
+
+    repository.save_subtitles(
+        [
+            make_subtitle(tmp_path, "1_ddddddddddd_Title.en.vtt"),
+            make_subtitle(tmp_path, "2_eeeeeeeeeee_Title.en.vtt"),
+        ]
+    )
+    repository.flush()
+
+    index_file = tmp_path / FileSystemSubtitleRepository.INDEX_FILENAME
+    data = json.loads(index_file.read_text(encoding="utf-8"))
+    assert data["video_ids"] == ["ddddddddddd", "eeeeeeeeeee"]
+    assert data["dir_mtime_ns"] == tmp_path.stat().st_mtime_ns
+
+
+def test_subtitle_exists_uses_downloaded_ids(tmp_path: Path) -> None:
+    (tmp_path / "1_aaaaaaaaaaa_Title.en.vtt").write_text("WEBVTT\n", encoding="utf-8")
+    repository = FileSystemSubtitleRepository(tmp_path)
+
+    assert repository.subtitle_exists(VideoId("aaaaaaaaaaa"))
+    assert not repository.subtitle_exists(VideoId("bbbbbbbbbbb"))
+
+    repository.save_subtitle(make_subtitle(tmp_path, "2_bbbbbbbbbbb_Title.en.vtt"))
+    assert repository.subtitle_exists(VideoId("bbbbbbbbbbb"))
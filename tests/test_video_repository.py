@@ -1,4 +1,12 @@
-from ytdlp_subs.infrastructure.command_executor import CommandExecutor
+import json
+from datetime import datetime
+from typing import Callable, Optional
+
+import pytest
+
+from ytdlp_subs.domain.exceptions import VideoFetchError
+from ytdlp_subs.domain.models import SubtitleLanguage, VideoId
+from ytdlp_subs.infrastructure.command_executor import CommandExecutor, CommandResult
 from ytdlp_subs.infrastructure.repositories.video_repository import YtDlpVideoRepository
 
 
@@ -13,7 +21,7 @@ def test_watch_url_with_list_is_treated_as_playlist() -> None:
     command = repo._build_channel_command(url)
 
     assert not repo.is_video_url(url)
-    assert command[-4:] == ["--flat-playlist", "--print", "id", url]
+    assert command[-5:] == ["--lazy-playlist", "--flat-playlist", "--print", "id", url]
 
 
 def test_short_url_with_list_is_treated_as_playlist() -> None:
@@ -23,7 +31,7 @@ def test_short_url_with_list_is_treated_as_playlist() -> None:
     command = repo._build_channel_command(url)
 
     assert not repo.is_video_url(url)
-    assert command[-4:] == ["--flat-playlist", "--print", "id", url]
+    assert command[-5:] == ["--lazy-playlist", "--flat-playlist", "--print", "id", url]
 
 
 def test_plain_watch_url_is_treated_as_single_video() -> None:
@@ -44,3 +52,69 @@ def test_plain_short_url_is_treated_as_single_video() -> None:
 
     assert repo.is_video_url(url)
     assert command[-4:] == ["--no-playlist", "--print", "id", url]
+
+
+class StreamingCommandExecutor(CommandExecutor):
+    def __init__(self, lines: list[str]) -> None:
+        super().__init__()
+        self.lines = lines
+
+    def execute_streaming(
+        self,
+        command: list[str],
+        on_line: Callable[[str], None],
+        check: bool = True,
+        input_text: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> CommandResult:
+        for line in self.lines:
+            on_line(line)
+        return CommandResult("", "", 0, command)
+
+
+def test_channel_video_ids_are_parsed_from_streamed_lines() -> None:
+    executor = StreamingCommandExecutor(["aaaaaaaaaaa", "", "  bbbbbbbbbbb  "])
+    repo = YtDlpVideoRepository(command_executor=executor)
+
+    video_ids = repo.get_channel_video_ids("https://www.youtube.com/@channel")
+
+    assert video_ids == [VideoId("aaaaaaaaaaa"), VideoId("bbbbbbbbbbb")]
+
+
+def test_metadata_is_parsed_from_printed_fields() -> None:
+    fields = {
+        "id": "aaaaaaaaaaa",
+        "title": "Intro",
+        "upload_date": "20240131",
+        "automatic_captions": {"en": [], "xx": []},
+    }
+    executor = StreamingCommandExecutor([json.dumps(fields)])
+    repo = YtDlpVideoRepository(command_executor=executor)
+
+    metadata = repo.get_video_metadata(VideoId("aaaaaaaaaaa"))
+
+    assert metadata.title == "Intro"
+    assert metadata.upload_date == datetime(2024, 1, 31)
+    assert metadata.available_subtitles == [SubtitleLanguage.ENGLISH]
+    assert "--dump-json" not in repo._build_metadata_command(VideoId("aaaaaaaaaaa").url)
+
+
+def test_metadata_keeps_only_allowed_caption_languages() -> None:
+    fields = {"id": "aaaaaaaaaaa", "automatic_captions": {"EN": [], "hi": [], "fr": [], "xx": []}}
+    executor = StreamingCommandExecutor([json.dumps(fields)])
+    repo = YtDlpVideoRepository(command_executor=executor, allowed_langs=frozenset({"hi", "en"}))
+
+    metadata = repo.get_video_metadata(VideoId("aaaaaaaaaaa"))
+
+    assert metadata.available_subtitles == [SubtitleLanguage.ENGLISH, SubtitleLanguage.HINDI]
+
+
+def test_channel_fetch_errors_are_wrapped_in_video_fetch_error() -> None:
+    class BrokenCommandExecutor(CommandExecutor):
+        def execute_streaming(self, *args: object, **kwargs: object) -> CommandResult:
+            raise OSError("pipe closed")
+
+    repo = YtDlpVideoRepository(command_executor=BrokenCommandExecutor())
+
+    with pytest.raises(VideoFetchError, match="pipe closed"):
+        repo.get_channel_video_ids("https://www.youtube.com/@channel")
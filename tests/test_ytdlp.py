@@ -0,0 +1,50 @@
+from ytdlp_subs.infrastructure import ytdlp
+from ytdlp_subs.infrastructure.ytdlp import build_base_command, with_android_fallback, ytdlp_executable
+
+
+def test_executable_is_resolved_once(monkeypatch) -> None:
+    lookups: list[str] = []
+
+    def which(name: str) -> str:
+        lookups.append(name)
+        return f"/opt/bin/{name}"
+
+    monkeypatch.setattr(ytdlp.shutil, "which", which)
+    ytdlp_executable.cache_clear()
+    try:
+        assert build_base_command("node", "ejs:github")[0] == "/opt/bin/yt-dlp"
+        assert build_base_command("node", "ejs:github", "firefox")[-2:] == [
+            "--cookies-from-browser",
+            "firefox",
+        ]
+        assert lookups == ["yt-dlp"]
+    finally:
+        ytdlp_executable.cache_clear()
+
+
+def test_android_fallback_goes_before_url() -> None:
+    command = with_android_fallback(["yt-dlp", "--print", "id", "URL"])
+
+    assert command == [
+        "yt-dlp",
+        "--print",
+        "id",
+        "--extractor-args",
+        "youtube:player_client=android",
+        "URL",
+    ]
+
+
+def test_android_fallback_merges_existing_youtube_extractor_args() -> None:
+    command = with_android_fallback(
+        ["yt-dlp", "--extractor-args", "youtube:skip=dash,hls", "--print", "id", "URL"]
+    )
+
+    assert command == [
+        "yt-dlp",
+        "--extractor-args",
+        "youtube:player_client=android;skip=dash,hls",
+        "--print",
+        "id",
+        "URL",
+    ]
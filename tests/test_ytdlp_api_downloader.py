@@ -0,0 +1,71 @@
+from pathlib import Path
+from typing import Any
+
+import yt_dlp
+
+from ytdlp_subs.application.services import ytdlp_api_downloader
+from ytdlp_subs.application.services.ytdlp_api_downloader import YtDlpApiSubtitleDownloader
+from ytdlp_subs.domain.models import SubtitleLanguage, VideoId
+from ytdlp_subs.infrastructure.command_executor import CommandExecutor
+
+
+class FakeYoutubeDL:
+    instances: list["FakeYoutubeDL"] = []
+
+    def __init__(self, params: dict[str, Any]) -> None:
+        self.params = params
+        self.urls: list[str] = []
+        self.closed = False
+        FakeYoutubeDL.instances.append(self)
+
+    def close(self) -> None:
+        self.closed = True
+
+    def __enter__(self) -> "FakeYoutubeDL":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def extract_info(self, url: str, download: bool) -> dict[str, Any]:
+        self.urls.append(url)
+        video_id = url.rsplit("=", 1)[-1]
+        if video_id.startswith("b"):
+            raise yt_dlp.utils.DownloadError(f"ERROR: [youtube] {video_id}: Private video")
+        path = Path(self.params["outtmpl"]["default"].replace("%(id)s", video_id) + ".en.vtt")
+        path.write_text("WEBVTT\n", encoding="utf-8")
+        return {"id": video_id, "requested_subtitles": {"en": {"ext": "vtt", "filepath": str(path)}}}
+
+
+def test_batch_download_runs_yt_dlp_in_process(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(ytdlp_api_downloader, "YoutubeDL", FakeYoutubeDL)
+    FakeYoutubeDL.instances = []
+    ok, broken = VideoId("aaaaaaaaaaa"), VideoId("bbbbbbbbbbb")
+    downloader = YtDlpApiSubtitleDownloader(command_executor=CommandExecutor())
+
+    results = downloader.download_subtitles_batch([ok, broken], [SubtitleLanguage.ENGLISH], tmp_path)
+
+    assert results[ok].subtitle_file.file_path == tmp_path / "aaaaaaaaaaa.temp.en.vtt"
+    assert results[broken].failed
+    assert "Private video" in results[broken].error.message
+
+    first, fallback = FakeYoutubeDL.instances
+    assert first.params["skip_download"] and first.params["writeautomaticsub"]
+    assert first.params["subtitleslangs"] == ["en"]
+    assert fallback.urls == [broken.url]
+    assert fallback.params["extractor_args"]["youtube"]["player_client"] == ["android"]
+
+
+def test_youtubedl_instance_is_reused_across_batches(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(ytdlp_api_downloader, "YoutubeDL", FakeYoutubeDL)
+    FakeYoutubeDL.instances = []
+    downloader = YtDlpApiSubtitleDownloader(command_executor=CommandExecutor())
+
+    downloader.download_subtitles_batch([VideoId("aaaaaaaaaaa")], [SubtitleLanguage.ENGLISH], tmp_path)
+    downloader.download_subtitles_batch([VideoId("ccccccccccc")], [SubtitleLanguage.ENGLISH], tmp_path)
+
+    (ydl,) = FakeYoutubeDL.instances
+    assert ydl.urls == [VideoId("aaaaaaaaaaa").url, VideoId("ccccccccccc").url]
+
+    downloader.close()
+    assert ydl.closed